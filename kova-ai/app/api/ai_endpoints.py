@@ -4,9 +4,39 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 import json
+import orjson
+from datetime import datetime, timezone
 
 router = APIRouter(prefix="/ai")
 
+# Shared client for GitHub and Anthropic calls. HTTP/2 lets concurrent
+# requests multiplex over one kept-alive connection per host.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=200,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client; registered as a shutdown handler"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class ClaudeCommand(BaseModel):
     command: str
@@ -108,26 +138,28 @@ async def fetch_repository_data(repository: str, github_token: str) -> Dict[str,
 
     headers = {"Authorization": f"token {github_token}"}
 
-    async with httpx.AsyncClient() as client:
-        # Basic repo info
-        repo_response = await client.get(
-            f"https://api.github.com/repos/{repository}", headers=headers
-        )
-        repo_data = repo_response.json()
+    client = get_http_client()
+    # Basic repo info
+    repo_response = await client.get(
+        f"https://api.github.com/repos/{repository}", headers=headers
+    )
+    repo_data = orjson.loads(repo_response.content)
 
-        # Repository contents
-        contents_response = await client.get(
-            f"https://api.github.com/repos/{repository}/contents", headers=headers
-        )
-        contents_data = (
-            contents_response.json() if contents_response.status_code == 200 else []
-        )
+    # Repository contents
+    contents_response = await client.get(
+        f"https://api.github.com/repos/{repository}/contents", headers=headers
+    )
+    contents_data = (
+        orjson.loads(contents_response.content)
+        if contents_response.status_code == 200
+        else []
+    )
 
-        return {
-            "repository": repo_data,
-            "contents": contents_data,
-            "timestamp": "2025-10-20 14:38:05",
-        }
+    return {
+        "repository": repo_data,
+        "contents": contents_data,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
 
 
 async def get_repository_structure(
@@ -136,24 +168,30 @@ async def get_repository_structure(
     """Get repository file structure"""
     headers = {"Authorization": f"token {github_token}"}
 
-    async with httpx.AsyncClient() as client:
-        tree_response = await client.get(
-            f"https://api.github.com/repos/{repository}/git/trees/main?recursive=1",
-            headers=headers,
-        )
-        return tree_response.json() if tree_response.status_code == 200 else {}
+    client = get_http_client()
+    tree_response = await client.get(
+        f"https://api.github.com/repos/{repository}/git/trees/main?recursive=1",
+        headers=headers,
+    )
+    return (
+        orjson.loads(tree_response.content) if tree_response.status_code == 200 else {}
+    )
 
 
 async def get_recent_commits(repository: str, github_token: str) -> Dict[str, Any]:
     """Get recent commits"""
     headers = {"Authorization": f"token {github_token}"}
 
-    async with httpx.AsyncClient() as client:
-        commits_response = await client.get(
-            f"https://api.github.com/repos/{repository}/commits?per_page=10",
-            headers=headers,
-        )
-        return commits_response.json() if commits_response.status_code == 200 else []
+    client = get_http_client()
+    commits_response = await client.get(
+        f"https://api.github.com/repos/{repository}/commits?per_page=10",
+        headers=headers,
+    )
+    return (
+        orjson.loads(commits_response.content)
+        if commits_response.status_code == 200
+        else []
+    )
 
 
 async def get_file_content(
@@ -162,24 +200,30 @@ async def get_file_content(
     """Get specific file content"""
     headers = {"Authorization": f"token {github_token}"}
 
-    async with httpx.AsyncClient() as client:
-        file_response = await client.get(
-            f"https://api.github.com/repos/{repository}/contents/{file_path}",
-            headers=headers,
-        )
-        return file_response.json() if file_response.status_code == 200 else {}
+    client = get_http_client()
+    file_response = await client.get(
+        f"https://api.github.com/repos/{repository}/contents/{file_path}",
+        headers=headers,
+    )
+    return (
+        orjson.loads(file_response.content) if file_response.status_code == 200 else {}
+    )
 
 
 async def get_user_repositories(username: str, github_token: str) -> Dict[str, Any]:
     """Get all user repositories"""
     headers = {"Authorization": f"token {github_token}"}
 
-    async with httpx.AsyncClient() as client:
-        repos_response = await client.get(
-            f"https://api.github.com/users/{username}/repos?per_page=100",
-            headers=headers,
-        )
-        return repos_response.json() if repos_response.status_code == 200 else []
+    client = get_http_client()
+    repos_response = await client.get(
+        f"https://api.github.com/users/{username}/repos?per_page=100",
+        headers=headers,
+    )
+    return (
+        orjson.loads(repos_response.content)
+        if repos_response.status_code == 200
+        else []
+    )
 
 
 async def get_kova_repositories(github_token: str) -> Dict[str, Any]:
@@ -190,20 +234,20 @@ async def get_kova_repositories(github_token: str) -> Dict[str, Any]:
     kova_repos = await load_kova_repos_from_config()
 
     repo_data = {}
-    async with httpx.AsyncClient() as client:
-        for repo in kova_repos:
-            response = await client.get(
-                f"https://api.github.com/repos/{repo}", headers=headers
-            )
-            if response.status_code == 200:
-                repo_data[repo] = response.json()
-            else:
-                # Log repo that might not exist yet
-                repo_data[repo] = {
-                    "status": "not_found",
-                    "message": f"Repository {repo} not found or not accessible",
-                    "planned": True,
-                }
+    client = get_http_client()
+    for repo in kova_repos:
+        response = await client.get(
+            f"https://api.github.com/repos/{repo}", headers=headers
+        )
+        if response.status_code == 200:
+            repo_data[repo] = orjson.loads(response.content)
+        else:
+            # Log repo that might not exist yet
+            repo_data[repo] = {
+                "status": "not_found",
+                "message": f"Repository {repo} not found or not accessible",
+                "planned": True,
+            }
 
     return repo_data
 
@@ -252,12 +296,16 @@ async def get_latest_activity(username: str, github_token: str) -> Dict[str, Any
     """Get latest user activity"""
     headers = {"Authorization": f"token {github_token}"}
 
-    async with httpx.AsyncClient() as client:
-        events_response = await client.get(
-            f"https://api.github.com/users/{username}/events?per_page=20",
-            headers=headers,
-        )
-        return events_response.json() if events_response.status_code == 200 else []
+    client = get_http_client()
+    events_response = await client.get(
+        f"https://api.github.com/users/{username}/events?per_page=20",
+        headers=headers,
+    )
+    return (
+        orjson.loads(events_response.content)
+        if events_response.status_code == 200
+        else []
+    )
 
 
 async def send_to_claude(data: Dict[str, Any], prompt: str, anthropic_key: str) -> str:
@@ -274,17 +322,20 @@ async def send_to_claude(data: Dict[str, Any], prompt: str, anthropic_key: str)
         "messages": [
             {
                 "role": "user",
-                "content": f"Repository data: {json.dumps(data, indent=2)}\n\nUser request: {prompt}",
+                "content": f"Repository data: {orjson.dumps(data).decode()}\n\nUser request: {prompt}",
             }
         ],
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.anthropic.com/v1/messages", headers=headers, json=payload
-        )
-        if response.status_code == 200:
-            result = response.json()
-            return result.get("content", [{}])[0].get("text", "No response from Claude")
-        else:
-            return f"Error communicating with Claude: {response.status_code}"
+    client = get_http_client()
+    response = await client.post(
+        "https://api.anthropic.com/v1/messages",
+        headers=headers,
+        content=orjson.dumps(payload),
+        timeout=60.0,
+    )
+    if response.status_code == 200:
+        result = orjson.loads(response.content)
+        return result.get("content", [{}])[0].get("text", "No response from Claude")
+    else:
+        return f"Error communicating with Claude: {response.status_code}"
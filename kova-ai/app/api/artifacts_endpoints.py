@@ -11,9 +11,19 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from fastapi import APIRouter, HTTPException  # noqa: E402
 from pydantic import BaseModel  # noqa: E402
-from typing import Optional, Dict, Any  # noqa: E402
+from typing import Optional, Dict, Any, List  # noqa: E402
 
-from services.claude_connector import ClaudeConnector, ArtifactType  # noqa: E402
+from services.claude_connector import (  # noqa: E402
+    ArtifactType,
+    ClaudeConnector,
+)
+
+# Re-exported for main.py's shutdown hook. It must come through this import
+# path: services.claude_connector (via sys.path) and the app.services module
+# are separate module objects, each with its own shared client.
+from services.claude_connector import (  # noqa: E402,F401
+    close_client as close_claude_client,
+)
 
 router = APIRouter(prefix="/artifacts", tags=["artifacts"])
 
@@ -73,6 +83,33 @@ async def create_artifact(request: CreateArtifactRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/batch", response_model=List[ArtifactResponse])
+async def create_artifacts_batch(requests: List[CreateArtifactRequest]):
+    """
+    Create several independent artifacts concurrently
+
+    Results are returned in request order; one failure does not fail the batch.
+    """
+    try:
+        connector = ClaudeConnector()
+
+        results = await connector.create_artifacts_batch(
+            [(r.name, r.artifact_type, r.description, r.context) for r in requests]
+        )
+
+        return [
+            ArtifactResponse(
+                success=result.get("success", False),
+                data=result,
+                error=result.get("error"),
+            )
+            for result in results
+        ]
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/code/generate", response_model=ArtifactResponse)
 async def generate_code(request: GenerateCodeRequest):
     """
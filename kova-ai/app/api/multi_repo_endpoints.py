@@ -16,6 +16,13 @@ from typing import Optional, Dict, Any, List  # noqa: E402
 
 from services.multi_repo_sync_service import MultiRepoSyncService  # noqa: E402
 
+# Re-exported for main.py's shutdown hook. It must come through this import
+# path: services.multi_repo_sync_service (via sys.path) and the app.services
+# module are separate module objects, each with its own shared clients.
+from services.multi_repo_sync_service import (  # noqa: E402,F401
+    close_clients as close_sync_clients,
+)
+
 router = APIRouter(prefix="/multi-repo", tags=["multi-repo"])
 
 
@@ -11,6 +11,8 @@ import json
 import os
 import logging
 
+import orjson
+
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 logger = logging.getLogger(__name__)
 
@@ -39,7 +41,7 @@ def verify_github_signature(payload_body: bytes, signature_header: str) -> bool:
 async def process_webhook_background(event_type: str, payload: dict, delivery_id: str):
     """Process webhook in background"""
     try:
-        logger.info(f"Processing webhook: {event_type} - {delivery_id}")
+        logger.info("Processing webhook: %s - %s", event_type, delivery_id)
 
         # TODO: Store in database
         # db_event = WebhookEvent(
@@ -60,10 +62,10 @@ async def process_webhook_background(event_type: str, payload: dict, delivery_id
         elif event_type == "workflow_run":
             await handle_workflow_run_event(payload)
         else:
-            logger.info(f"Unhandled event type: {event_type}")
+            logger.info("Unhandled event type: %s", event_type)
 
     except Exception as e:
-        logger.error(f"Error processing webhook: {e}")
+        logger.error("Error processing webhook: %s", e)
 
 
 async def handle_push_event(payload: dict):
@@ -72,7 +74,7 @@ async def handle_push_event(payload: dict):
     ref = payload.get("ref")
     commits = payload.get("commits", [])
 
-    logger.info(f"Push to {repo_name} on {ref}: {len(commits)} commits")
+    logger.info("Push to %s on %s: %s commits", repo_name, ref, len(commits))
 
     # Forward to Claude for analysis
     analysis_data = {
@@ -92,7 +94,9 @@ async def handle_pull_request_event(payload: dict):
     pr = payload.get("pull_request", {})
     repo_name = payload.get("repository", {}).get("full_name")
 
-    logger.info(f"PR {action} in {repo_name}: #{pr.get('number')} - {pr.get('title')}")
+    logger.info(
+        "PR %s in %s: #%s - %s", action, repo_name, pr.get("number"), pr.get("title")
+    )
 
     analysis_data = {
         "event": "pull_request",
@@ -115,7 +119,11 @@ async def handle_issues_event(payload: dict):
     repo_name = payload.get("repository", {}).get("full_name")
 
     logger.info(
-        f"Issue {action} in {repo_name}: #{issue.get('number')} - {issue.get('title')}"
+        "Issue %s in %s: #%s - %s",
+        action,
+        repo_name,
+        issue.get("number"),
+        issue.get("title"),
     )
 
     analysis_data = {
@@ -138,7 +146,7 @@ async def handle_issue_comment_event(payload: dict):
     issue = payload.get("issue", {})
     repo_name = payload.get("repository", {}).get("full_name")
 
-    logger.info(f"Comment {action} in {repo_name} on issue #{issue.get('number')}")
+    logger.info("Comment %s in %s on issue #%s", action, repo_name, issue.get("number"))
 
     analysis_data = {
         "event": "issue_comment",
@@ -158,7 +166,7 @@ async def handle_workflow_run_event(payload: dict):
     status = workflow_run.get("status")
     conclusion = workflow_run.get("conclusion")
 
-    logger.info(f"Workflow {status}/{conclusion} in {repo_name}")
+    logger.info("Workflow %s/%s in %s", status, conclusion, repo_name)
 
     analysis_data = {
         "event": "workflow_run",
@@ -190,7 +198,7 @@ async def forward_to_claude(data: dict):
 
         prompt = f"""Analyze this GitHub webhook event:
 
-{json.dumps(data, indent=2)}
+{orjson.dumps(data).decode()}
 
 Provide insights about:
 1. What happened
@@ -206,19 +214,21 @@ Provide insights about:
 
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
-                "https://api.anthropic.com/v1/messages", headers=headers, json=payload
+                "https://api.anthropic.com/v1/messages",
+                headers=headers,
+                content=orjson.dumps(payload),
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 analysis = result.get("content", [{}])[0].get("text", "")
-                logger.info(f"Claude analysis: {analysis[:200]}...")
+                logger.info("Claude analysis: %s...", analysis[:200])
                 return analysis
             else:
-                logger.error(f"Claude API error: {response.status_code}")
+                logger.error("Claude API error: %s", response.status_code)
 
     except Exception as e:
-        logger.error(f"Error forwarding to Claude: {e}")
+        logger.error("Error forwarding to Claude: %s", e)
 
 
 @router.post("/github")
@@ -243,10 +253,12 @@ async def github_webhook(
             raise HTTPException(status_code=401, detail="Invalid signature")
 
         # Parse payload
-        payload = json.loads(body.decode())
+        payload = orjson.loads(body)
 
         # Log event
-        logger.info(f"Received GitHub webhook: {x_github_event} - {x_github_delivery}")
+        logger.info(
+            "Received GitHub webhook: %s - %s", x_github_event, x_github_delivery
+        )
 
         # Process in background
         background_tasks.add_task(
@@ -262,7 +274,7 @@ async def github_webhook(
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
     except Exception as e:
-        logger.error(f"Webhook error: {e}")
+        logger.error("Webhook error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -0,0 +1,96 @@
+"""
+Metrics Middleware
+
+Pure ASGI middleware that records request counts and latencies, and hands
+Prometheus scrapes straight to the metrics app so they skip the rest of the
+API middleware stack.
+"""
+
+import time
+from functools import lru_cache
+
+from prometheus_client import Counter, Histogram, make_asgi_app
+
+# Most GitHub calls land in 50-500ms and Claude calls in 2-20s, so the
+# buckets skip the sub-25ms range and stretch out to a minute
+REQUEST_DURATION_BUCKETS = (
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Label for requests that matched no route, so stray URLs share one series
+UNMATCHED_ENDPOINT = "<unmatched>"
+
+# Probe endpoints hit often enough that timing them is pure overhead
+UNTIMED_PATHS = frozenset({"/health"})
+
+request_count = Counter(
+    "kova_requests_total",
+    "HTTP requests",
+    ["method", "endpoint", "status"],
+)
+request_duration = Histogram(
+    "kova_request_duration_seconds",
+    "HTTP request duration",
+    ["method", "endpoint"],
+    buckets=REQUEST_DURATION_BUCKETS,
+)
+
+
+@lru_cache(maxsize=None)
+def _series(method: str, endpoint: str, status: str):
+    """
+    Bound counter and histogram children for one label set
+
+    Endpoints are route templates, so the cache stays small, and repeat
+    requests skip prometheus_client's label validation and lock.
+    """
+    return (
+        request_count.labels(method, endpoint, status),
+        request_duration.labels(method, endpoint),
+    )
+
+
+class MetricsMiddleware:
+    """Serve `path` from the Prometheus ASGI app; time everything but probes"""
+
+    def __init__(self, app, path: str = "/metrics"):
+        self.app = app
+        self.path = path
+        self.metrics_app = make_asgi_app()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in UNTIMED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        if scope["path"] == self.path:
+            await self.metrics_app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Label by the route template, e.g. /repos/{name}, not the raw URL
+            route = scope.get("route")
+            endpoint = getattr(route, "path", UNMATCHED_ENDPOINT)
+            count, duration = _series(scope["method"], endpoint, str(status))
+            duration.observe(time.perf_counter() - start)
+            count.inc()
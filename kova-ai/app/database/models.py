@@ -8,6 +8,7 @@ from sqlalchemy import (
     JSON,
     ForeignKey,
     Enum,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from .session import Base
@@ -29,6 +30,13 @@ class SyncStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+class ErrorSeverity(str, enum.Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+
 class Repository(Base):
     __tablename__ = "repository"
 
@@ -55,11 +63,23 @@ class Repository(Base):
 
 class Error(Base):
     __tablename__ = "error"
+    # Open errors per repository: WHERE repository_id = ? AND resolved = false
+    __table_args__ = (
+        Index("ix_error_repository_resolved", "repository_id", "resolved"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     repository_id = Column(Integer, ForeignKey("repository.id"), nullable=True)
     error_type = Column(String(100), index=True)
-    severity = Column(String(50))  # critical, error, warning, info
+    # Stored by value ("critical"), matching severity_enum in init.sql
+    severity = Column(
+        Enum(
+            ErrorSeverity,
+            name="severity_enum",
+            values_callable=lambda e: [m.value for m in e],
+        ),
+        index=True,
+    )
     message = Column(Text, nullable=False)
     stack_trace = Column(Text)
     file_path = Column(String(500))
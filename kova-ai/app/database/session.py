@@ -1,9 +1,11 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 load_dotenv(BASE_DIR / ".env")
@@ -11,10 +13,37 @@ load_dotenv(BASE_DIR / ".env")
 DEFAULT_DATABASE_URL = "postgresql+asyncpg://kova:kova_pass@db:5432/kova"
 DATABASE_URL = os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
 
-engine = create_async_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+# The API runs as a single uvicorn worker, so 20 + 40 overflow stays well
+# under Postgres' default of 100 connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = 1800
+
+# Set KOVA_SCRIPT_MODE=1 in short-lived scripts that open sessions, so each
+# session gets its own connection and no pool is left to tear down at exit.
+# Either export it in the shell (KOVA_SCRIPT_MODE=1 python my_script.py) or
+# call os.environ.setdefault("KOVA_SCRIPT_MODE", "1") at the top of the
+# script; it is read when the engine is first built. The API leaves it unset.
+SCRIPT_MODE_ENV = "KOVA_SCRIPT_MODE"
+
 Base = declarative_base()
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Engine built on first use, so importing the models costs nothing"""
+    if os.getenv(SCRIPT_MODE_ENV):
+        return create_async_engine(DATABASE_URL, echo=True, poolclass=NullPool)
+    return create_async_engine(
+        DATABASE_URL,
+        echo=True,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_factory():
+    """Session factory bound to the shared engine"""
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
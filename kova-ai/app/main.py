@@ -1,6 +1,12 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from prometheus_client import make_asgi_app
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.utils import is_body_allowed_for_status_code
+from pydantic import BaseModel
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api import (
     health,
@@ -8,33 +14,118 @@ from app.api import (
     webhooks,
     multi_repo_endpoints,
     artifacts_endpoints,
-    export_endpoints,
 )
+from app.core.log_queue import start_queue_logging, stop_queue_logging
+from app.core.metrics import MetricsMiddleware
+from app.security.cors import CORSMiddleware
+from app.security.headers import SecurityHeadersMiddleware
 
-app = FastAPI(
-    title="Kova AI System API",
-    description="Multi-repository AI-powered development automation platform with Claude AI integration",
-    version="2.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
+# Pre-encoded body for unhandled errors; never changes, so build it once
+INTERNAL_ERROR_BODY = orjson.dumps({"detail": "Internal Server Error"})
+
+
+class ErrorResponse(BaseModel):
+    """Error body schema, for the OpenAPI docs only; never built at runtime"""
+
+    detail: Any
+
+
+@lru_cache(maxsize=128)
+def _encode_error_detail(detail: str) -> bytes:
+    """Encode a string error detail, reusing the bytes for repeated messages"""
+    return orjson.dumps({"detail": detail})
+
+
+# Error handlers
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Encode HTTP errors with orjson instead of the stdlib-backed JSONResponse"""
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    detail = exc.detail
+    return Response(
+        (
+            _encode_error_detail(detail)
+            if isinstance(detail, str)
+            else orjson.dumps({"detail": detail})
+        ),
+        status_code=exc.status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+async def general_exception_handler(request: Request, exc: Exception):
+    """Return the prebuilt 500 body for unhandled errors"""
+    return Response(
+        INTERNAL_ERROR_BODY, status_code=500, media_type="application/json"
+    )
+
+
+def create_app(*, enable_export: bool = True, enable_metrics: bool = True) -> FastAPI:
+    """
+    Build the Kova AI API application
+
+    Optional routers are imported only when enabled, so a trimmed profile
+    does not pay for them at startup. Use with
+    `uvicorn app.main:create_app --factory`.
+    """
+    app = FastAPI(
+        title="Kova AI System API",
+        description="Multi-repository AI-powered development automation platform with Claude AI integration",
+        version="2.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        responses={500: {"model": ErrorResponse, "description": "Internal error"}},
+        default_response_class=ORJSONResponse,
+    )
+
+    app.add_middleware(SecurityHeadersMiddleware)
+
+    # CORS; allow-all with credentials. Outside the other middleware so
+    # preflights are answered before any of it runs
+    app.add_middleware(CORSMiddleware)
+
+    # Metrics; added last so it runs outermost and scrapes bypass the above
+    if enable_metrics:
+        app.add_middleware(MetricsMiddleware)
+
+    # Routers
+    app.include_router(health.router)
+    app.include_router(ai_endpoints.router)
+    app.include_router(webhooks.router)
+    app.include_router(multi_repo_endpoints.router)
+    app.include_router(artifacts_endpoints.router)
+
+    if enable_export:
+        from app.api import export_endpoints
+
+        app.include_router(export_endpoints.router)
+
+    app.add_event_handler("startup", start_queue_logging)
+    app.add_event_handler("shutdown", ai_endpoints.close_http_client)
+    app.add_event_handler("shutdown", artifacts_endpoints.close_claude_client)
+    app.add_event_handler("shutdown", multi_repo_endpoints.close_sync_clients)
+    app.add_event_handler("shutdown", stop_queue_logging)
+
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(Exception, general_exception_handler)
+
+    return app
+
+
+app = create_app()
 
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# Routers
-app.include_router(health.router)
-app.include_router(ai_endpoints.router)
-app.include_router(webhooks.router)
-app.include_router(multi_repo_endpoints.router)
-app.include_router(artifacts_endpoints.router)
-app.include_router(export_endpoints.router)
+if __name__ == "__main__":
+    import uvicorn
 
-# Metrics
-app.mount("/metrics", make_asgi_app())
+    # uvloop and httptools ship with uvicorn[standard]
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        proxy_headers=True,
+    )
@@ -0,0 +1,100 @@
+"""
+CORS Middleware
+
+Pure ASGI replacement for Starlette's CORSMiddleware, specialised for this
+API's allow-everything policy with credentials. Every header value except the
+echoed origin and requested headers is constant, so it is encoded once here.
+"""
+
+from typing import List, Tuple
+
+ALLOW_METHODS = frozenset(
+    (b"DELETE", b"GET", b"HEAD", b"OPTIONS", b"PATCH", b"POST", b"PUT")
+)
+
+# Sent with every preflight response, before the echoed origin/headers
+PREFLIGHT_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"vary", b"Origin"),
+    (b"access-control-allow-methods", b", ".join(sorted(ALLOW_METHODS))),
+    (b"access-control-max-age", b"600"),
+    (b"access-control-allow-credentials", b"true"),
+]
+
+# Sent with every CORS response to a non-preflight request
+SIMPLE_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"access-control-allow-credentials", b"true"),
+]
+
+
+class CORSMiddleware:
+    """
+    Allow all origins, methods and headers, with credentials
+
+    Preflights are answered here and never reach the app. Because credentials
+    are allowed, the request's Origin (and requested headers) are echoed back
+    wherever a browser would reject a literal "*".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        has_cookie = False
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"cookie":
+                has_cookie = True
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin, request_method, request_headers)
+            return
+
+        if has_cookie:
+            extra = SIMPLE_HEADERS + [
+                (b"access-control-allow-origin", origin),
+                (b"vary", b"Origin"),
+            ]
+        else:
+            extra = SIMPLE_HEADERS + [(b"access-control-allow-origin", b"*")]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + extra
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    @staticmethod
+    async def _preflight(send, origin, request_method, request_headers):
+        """Answer a preflight request without calling the app"""
+        headers = PREFLIGHT_HEADERS + [(b"access-control-allow-origin", origin)]
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        if request_method in ALLOW_METHODS:
+            status, body = 204, b""
+        else:
+            status, body = 400, b"Disallowed CORS method"
+            headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", str(len(body)).encode()))
+
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,35 @@
+"""
+Security Headers Middleware
+
+Pure ASGI middleware that appends a fixed set of security headers to every
+HTTP response.
+"""
+
+from typing import List, Tuple
+
+# Raw ASGI header pairs, encoded once at import
+SECURITY_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"cross-origin-opener-policy", b"same-origin"),
+]
+
+
+class SecurityHeadersMiddleware:
+    """Add SECURITY_HEADERS to HTTP responses"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + SECURITY_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
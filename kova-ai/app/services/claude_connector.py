@@ -10,15 +10,137 @@ Provides comprehensive integration with Claude AI including:
 """
 
 import os
+import re
+import time
+import asyncio
+import hashlib
 import httpx
-import json
 import logging
-from typing import Dict, List, Any, Optional
+import orjson
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# In-flight Messages API calls keyed by (api key, payload). Shared across
+# connector instances so concurrent identical requests cost one round trip.
+_inflight: Dict[Tuple[str, bytes], "asyncio.Future[Dict[str, Any]]"] = {}
+
+# Successful generate_code/analyze_code results keyed by an input digest,
+# least recently used first, as (stored at, result)
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 3600.0
+_response_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Pooled client shared by every connector; API key headers are sent per call
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Messages API client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared Messages API client; registered as a shutdown handler"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _response_key(*parts: Optional[str]) -> str:
+    """Digest of a call's inputs, used as the response cache key"""
+    joined = "\x1f".join(part or "" for part in parts)
+    return hashlib.blake2b(joined.encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached result, or None if it is missing or expired"""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at > RESPONSE_CACHE_TTL:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return dict(result)
+
+
+def _cache_put(key: str, result: Dict[str, Any]):
+    """Store a result, evicting the least recently used one when full"""
+    _response_cache[key] = (time.monotonic(), result)
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def _compact_json(data: Any) -> str:
+    """Serialise data for a prompt; compact output costs fewer input tokens"""
+    return orjson.dumps(data).decode()
+
+
+# A fenced block: opening fence with optional language, then the body up to a
+# closing fence line or, for a truncated reply, the end of the text
+CODE_BLOCK_RE = re.compile(r"^[ \t]*```([^\n]*)\n(.*?)(?:^[ \t]*```|\Z)", re.M | re.S)
+
+# Marks the end of a prompt prefix for Anthropic's server-side prompt cache
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _with_cache_breakpoint(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a message, marking its last content block as a cache breakpoint"""
+    content = message["content"]
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = [dict(block) for block in content]
+    blocks[-1]["cache_control"] = CACHE_CONTROL
+    return {**message, "content": blocks}
+
+
+@lru_cache(maxsize=64)
+def _system_blocks(system_prompt: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    System prompt as a single text block marked as a cache breakpoint
+
+    Built once per distinct prompt; the tuple is shared across requests and
+    must not be modified.
+    """
+    return ({"type": "text", "text": system_prompt, "cache_control": CACHE_CONTROL},)
+
+
+@lru_cache(maxsize=32)
+def _code_system_prompt(language: str) -> str:
+    """System prompt for generate_code, built once per language"""
+    return f"""You are an expert {language} programmer. Generate clean,
+efficient, well-documented code that follows best practices."""
+
+
+@lru_cache(maxsize=32)
+def _review_system_prompt(language: str) -> str:
+    """System prompt for analyze_code, built once per language"""
+    return f"""You are an expert code reviewer specializing in {language}.
+Analyze code for bugs, security issues, performance, and best practices."""
+
+
+@lru_cache(maxsize=32)
+def _config_system_prompt(config_format: str) -> str:
+    """System prompt for generate_config, built once per format"""
+    return f"""You are an expert at creating well-structured {config_format}
+configuration files."""
+
 
 class ArtifactType(str, Enum):
     CODE = "code"
@@ -42,14 +164,16 @@ class ClaudeConnector:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY is required")
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get API request headers"""
-        return {
+        self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "anthropic-version": "2023-06-01",
         }
 
+    def _get_headers(self) -> Dict[str, str]:
+        """Get API request headers"""
+        return self._headers
+
     async def send_message(
         self,
         prompt: str,
@@ -57,6 +181,8 @@ class ClaudeConnector:
         conversation_history: Optional[List[Dict]] = None,
         temperature: float = 1.0,
         max_tokens: Optional[int] = None,
+        cache: bool = True,
+        stop_sequences: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Send a message to Claude
@@ -67,54 +193,182 @@ class ClaudeConnector:
             conversation_history: Previous messages
             temperature: Randomness (0-1)
             max_tokens: Maximum response length
+            cache: Mark the system prompt and history as prompt-cache prefixes
+            stop_sequences: Strings that end generation when produced
 
         Returns:
             Response with message and metadata
         """
         try:
-            messages = conversation_history or []
-            messages.append({"role": "user", "content": prompt})
-
-            payload = {
-                "model": self.model,
-                "max_tokens": max_tokens or self.max_tokens,
-                "temperature": temperature,
-                "messages": messages,
-            }
-
-            if system_prompt:
-                payload["system"] = system_prompt
-
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/messages",
-                    headers=self._get_headers(),
-                    json=payload,
-                )
+            payload = self._build_payload(
+                prompt,
+                system_prompt,
+                conversation_history,
+                temperature,
+                max_tokens,
+                cache,
+                stop_sequences,
+            )
 
-                response.raise_for_status()
-                result = response.json()
+            result = await self._coalesced_post(payload)
 
-                return {
-                    "success": True,
-                    "content": result.get("content", [{}])[0].get("text", ""),
-                    "model": result.get("model"),
-                    "usage": result.get("usage", {}),
-                    "stop_reason": result.get("stop_reason"),
-                    "id": result.get("id"),
-                }
+            return {
+                "success": True,
+                "content": result.get("content", [{}])[0].get("text", ""),
+                "model": result.get("model"),
+                "usage": result.get("usage", {}),
+                "stop_reason": result.get("stop_reason"),
+                "id": result.get("id"),
+            }
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"Claude API HTTP error: {e}")
+            logger.error("Claude API HTTP error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "status_code": e.response.status_code,
             }
         except Exception as e:
-            logger.error(f"Claude API error: {e}")
+            logger.error("Claude API error: %s", e)
             return {"success": False, "error": str(e)}
 
+    def _build_payload(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        conversation_history: Optional[List[Dict]],
+        temperature: float,
+        max_tokens: Optional[int],
+        cache: bool,
+        stop_sequences: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build a Messages API request body"""
+        # Always a new list; the caller's history is never modified
+        user_message = {"role": "user", "content": prompt}
+        if not conversation_history:
+            messages = [user_message]
+        elif cache:
+            # Cache the conversation so far, marking a copy of its last turn
+            messages = [
+                *conversation_history[:-1],
+                _with_cache_breakpoint(conversation_history[-1]),
+                user_message,
+            ]
+        else:
+            messages = [*conversation_history, user_message]
+
+        payload = {
+            "model": self.model,
+            "max_tokens": max_tokens or self.max_tokens,
+            "temperature": temperature,
+            "messages": messages,
+        }
+
+        if system_prompt:
+            payload["system"] = (
+                _system_blocks(system_prompt) if cache else system_prompt
+            )
+
+        if stop_sequences:
+            payload["stop_sequences"] = stop_sequences
+
+        return payload
+
+    async def stream_message(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        conversation_history: Optional[List[Dict]] = None,
+        temperature: float = 1.0,
+        max_tokens: Optional[int] = None,
+        cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a reply from Claude as it is generated
+
+        Takes the same arguments as send_message, but yields text deltas from
+        the server-sent event stream instead of waiting for the full reply.
+        Errors are raised rather than returned.
+
+        Yields:
+            Chunks of response text
+        """
+        payload = self._build_payload(
+            prompt, system_prompt, conversation_history, temperature, max_tokens, cache
+        )
+        payload["stream"] = True
+
+        async with _get_client().stream(
+            "POST",
+            f"{self.base_url}/messages",
+            headers=self._get_headers(),
+            content=orjson.dumps(payload),
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = orjson.loads(line[5:])
+                event_type = event.get("type")
+                if event_type == "content_block_delta":
+                    text = event["delta"].get("text")
+                    if text:
+                        yield text
+                elif event_type == "error":
+                    raise RuntimeError(event["error"].get("message", "stream error"))
+                elif event_type == "message_stop":
+                    break
+
+    async def _coalesced_post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST to the Messages API, sharing the round trip with any identical
+        request already in flight.
+
+        The first caller sends the request on its own coroutine, with no
+        extra Task, and publishes a bare Future that only later callers with
+        the same payload wait on.
+        """
+        key = (self.api_key, orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+        shared = _inflight.get(key)
+        if shared is not None:
+            try:
+                # Shield so a cancelled follower does not cancel the leader
+                return await asyncio.shield(shared)
+            except asyncio.CancelledError:
+                # Retry on our own if only the leading caller was cancelled
+                if not shared.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self._coalesced_post(payload)
+
+        shared = asyncio.get_running_loop().create_future()
+        _inflight[key] = shared
+        try:
+            result = await self._post_message(payload)
+        except asyncio.CancelledError:
+            shared.cancel()
+            raise
+        except Exception as e:
+            shared.set_exception(e)
+            # Mark retrieved; the error is re-raised to this caller below
+            shared.exception()
+            raise
+        else:
+            shared.set_result(result)
+            return result
+        finally:
+            _inflight.pop(key, None)
+
+    async def _post_message(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single Messages API request and return the decoded body"""
+        response = await _get_client().post(
+            f"{self.base_url}/messages",
+            headers=self._get_headers(),
+            content=orjson.dumps(payload),
+        )
+
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     async def generate_code(
         self, description: str, language: str = "python", context: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -129,8 +383,12 @@ class ClaudeConnector:
         Returns:
             Generated code and metadata
         """
-        system_prompt = f"""You are an expert {language} programmer. Generate clean,
-efficient, well-documented code that follows best practices."""
+        key = _response_key("generate_code", self.model, description, language, context)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        system_prompt = _code_system_prompt(language)
 
         prompt = f"""Generate {language} code for the following:
 
@@ -141,29 +399,30 @@ efficient, well-documented code that follows best practices."""
 
         prompt += """
 
-Please provide:
-1. Complete, working code
-2. Comments explaining key parts
-3. Usage example if applicable
-
-Format the code in a code block."""
+Respond with ONLY the complete, working code between <code> and </code> tags.
+Explain key parts in code comments, not prose."""
 
         result = await self.send_message(
-            prompt=prompt, system_prompt=system_prompt, max_tokens=4096
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=4096,
+            stop_sequences=["</code>"],
         )
 
         if result["success"]:
             # Extract code from response
             content = result["content"]
-            code = self._extract_code_block(content)
+            code = self._extract_tagged(content, "code")
 
-            return {
+            generated = {
                 "success": True,
                 "code": code,
                 "full_response": content,
                 "language": language,
                 "artifact_type": ArtifactType.CODE,
             }
+            _cache_put(key, generated)
+            return dict(generated)
 
         return result
 
@@ -181,8 +440,12 @@ Format the code in a code block."""
         Returns:
             Analysis results
         """
-        system_prompt = f"""You are an expert code reviewer specializing in {language}.
-Analyze code for bugs, security issues, performance, and best practices."""
+        key = _response_key("analyze_code", self.model, code, language, focus)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        system_prompt = _review_system_prompt(language)
 
         prompt = f"""Analyze this {language} code:
 
@@ -205,6 +468,10 @@ Provide analysis covering:
 
         result = await self.send_message(prompt=prompt, system_prompt=system_prompt)
 
+        if result["success"]:
+            _cache_put(key, result)
+            return dict(result)
+
         return result
 
     async def analyze_repository(self, repo_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -222,7 +489,7 @@ structures and provide insights about organization, patterns, and improvements."
 
         prompt = f"""Analyze this repository:
 
-{json.dumps(repo_data, indent=2)}
+{_compact_json(repo_data)}
 
 Provide analysis of:
 1. Repository structure and organization
@@ -258,7 +525,7 @@ Provide analysis of:
         if artifact_type == ArtifactType.CODE:
             language = context.get("language", "python") if context else "python"
             return await self.generate_code(
-                description, language, json.dumps(context) if context else None
+                description, language, _compact_json(context) if context else None
             )
 
         elif artifact_type == ArtifactType.DOCUMENT:
@@ -276,6 +543,33 @@ Provide analysis of:
                 "error": f"Unsupported artifact type: {artifact_type}",
             }
 
+    async def create_artifacts_batch(
+        self,
+        specs: List[Tuple[str, ArtifactType, str, Optional[Dict]]],
+        max_concurrency: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several independent artifacts concurrently
+
+        Args:
+            specs: (name, artifact_type, description, context) per artifact
+            max_concurrency: Maximum Claude requests in flight at once
+
+        Returns:
+            Created artifacts, in the same order as specs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create_one(spec) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.create_artifact(*spec)
+                except Exception as e:
+                    logger.error("Artifact '%s' failed: %s", spec[0], e)
+                    return {"success": False, "error": str(e)}
+
+        return await asyncio.gather(*(create_one(spec) for spec in specs))
+
     async def generate_document(
         self, title: str, description: str, context: Optional[Dict] = None
     ) -> Dict[str, Any]:
@@ -288,7 +582,7 @@ comprehensive documentation with proper structure and formatting."""
 {description}"""
 
         if context:
-            prompt += f"\n\nContext:\n{json.dumps(context, indent=2)}"
+            prompt += f"\n\nContext:\n{_compact_json(context)}"
 
         prompt += """
 
@@ -323,21 +617,20 @@ using Mermaid syntax."""
 {description}"""
 
         if context:
-            prompt += f"\n\nContext:\n{json.dumps(context, indent=2)}"
+            prompt += f"\n\nContext:\n{_compact_json(context)}"
 
         prompt += """
 
-Provide:
-1. Complete Mermaid code
-2. Diagram type explanation
-3. How to render it
-"""
+Respond with ONLY the complete Mermaid code between <mermaid> and </mermaid> tags.
+No prose."""
 
-        result = await self.send_message(prompt=prompt, system_prompt=system_prompt)
+        result = await self.send_message(
+            prompt=prompt, system_prompt=system_prompt, stop_sequences=["</mermaid>"]
+        )
 
         if result["success"]:
             content = result["content"]
-            diagram_code = self._extract_code_block(content, "mermaid")
+            diagram_code = self._extract_tagged(content, "mermaid", "mermaid")
 
             return {
                 "success": True,
@@ -354,29 +647,27 @@ Provide:
         """Generate configuration file"""
         config_format = context.get("format", "json") if context else "json"
 
-        system_prompt = f"""You are an expert at creating well-structured {config_format}
-configuration files."""
+        system_prompt = _config_system_prompt(config_format)
 
         prompt = f"""Create a {config_format} configuration for:
 
 {description}"""
 
         if context:
-            prompt += f"\n\nContext:\n{json.dumps(context, indent=2)}"
+            prompt += f"\n\nContext:\n{_compact_json(context)}"
 
         prompt += f"""
 
-Provide:
-1. Complete {config_format} configuration
-2. Explanation of key settings
-3. Usage instructions
-"""
+Respond with ONLY the complete {config_format} configuration between <config> and
+</config> tags. Explain key settings in comments where the format allows them."""
 
-        result = await self.send_message(prompt=prompt, system_prompt=system_prompt)
+        result = await self.send_message(
+            prompt=prompt, system_prompt=system_prompt, stop_sequences=["</config>"]
+        )
 
         if result["success"]:
             content = result["content"]
-            config_code = self._extract_code_block(content, config_format)
+            config_code = self._extract_tagged(content, "config", config_format)
 
             return {
                 "success": True,
@@ -394,6 +685,9 @@ Provide:
         """
         Conduct a multi-turn conversation
 
+        Turns run sequentially, since each one needs the previous reply.
+        Use create_artifacts_batch for independent requests.
+
         Args:
             messages: List of user messages
             system_prompt: System instructions
@@ -422,30 +716,42 @@ Provide:
 
         return responses
 
+    def _extract_tagged(
+        self, content: str, tag: str, language: Optional[str] = None
+    ) -> str:
+        """
+        Extract an artifact from between <tag> and </tag>
+
+        The closing tag is normally the stop sequence, so it is absent from
+        the reply. Falls back to markdown code blocks when the tag is missing
+        or the model fenced the artifact anyway.
+        """
+        open_tag = f"<{tag}>"
+        start = content.find(open_tag)
+        if start == -1:
+            return self._extract_code_block(content, language)
+
+        # Index held in a name so black's slice spacing cannot trip E203
+        body_start = start + len(open_tag)
+        body = content[body_start:]
+        end = body.find(f"</{tag}>")
+        if end != -1:
+            body = body[:end]
+        body = body.strip("\n")
+
+        if body.lstrip().startswith("```"):
+            return self._extract_code_block(body)
+        return body
+
     def _extract_code_block(self, content: str, language: str = None) -> str:
         """Extract code from markdown code blocks"""
-        lines = content.split("\n")
-        in_code_block = False
-        code_lines = []
-        block_language = None
-
-        for line in lines:
-            if line.strip().startswith("```"):
-                if not in_code_block:
-                    # Starting code block
-                    in_code_block = True
-                    block_language = line.strip()[3:].strip()
-                else:
-                    # Ending code block
-                    if language is None or block_language == language:
-                        break
-                    else:
-                        code_lines = []
-                    in_code_block = False
-            elif in_code_block:
-                code_lines.append(line)
-
-        return "\n".join(code_lines) if code_lines else content
+        for match in CODE_BLOCK_RE.finditer(content):
+            if language is None or match.group(1).strip() == language:
+                code = match.group(2)
+                if not code:
+                    return content
+                return code[:-1] if code.endswith("\n") else code
+        return content
 
 
 # Convenience functions
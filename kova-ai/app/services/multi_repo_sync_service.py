@@ -6,18 +6,172 @@ enabling cross-repo coordination, updates, and Claude AI integration.
 """
 
 import os
-import json
 import logging
 import asyncio
+import random
+import time
 import httpx
-from datetime import datetime
-from typing import Dict, List, Any
+import orjson
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from pathlib import Path
-from functools import wraps
+from functools import lru_cache, wraps
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# (epoch second, ISO string) for the last timestamp handed out
+_iso_cache: Tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO 8601, formatted at most once per second"""
+    global _iso_cache
+    now = int(time.time())
+    second, text = _iso_cache
+    if second != now:
+        text = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        _iso_cache = (now, text)
+    return text
+
+
+CONFIG_PATH = Path(__file__).parent.parent.parent.parent / "kova_repos_config.json"
+
+# GitHub requests allowed on the wire at once across all service instances
+GITHUB_CONCURRENCY = int(os.getenv("GH_CONCURRENCY", "10"))
+RATE_LIMIT_RETRIES = 5
+# Rate-limit waits longer than this fail fast instead of stalling the caller
+MAX_RATE_LIMIT_WAIT = 60.0
+# Start pausing when the primary rate limit drops below this many requests
+RATE_LIMIT_LOW_WATER = 5
+
+# Created per event loop: a semaphore belongs to the loop that first waits on it
+_github_gate: Optional[asyncio.Semaphore] = None
+_github_gate_loop: Optional[asyncio.AbstractEventLoop] = None
+# Epoch time until which new GitHub requests hold off; set near the limit
+_rate_limit_pause_until = 0.0
+
+# Shared clients, so repeated syncs reuse pooled connections
+_github_client: Optional[httpx.AsyncClient] = None
+_claude_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_github_client() -> httpx.AsyncClient:
+    """Return the shared GitHub API client, creating it on first use"""
+    global _github_client
+    if _github_client is None:
+        # HTTP/2 lets the concurrent per-repo requests share one connection
+        _github_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _github_client
+
+
+def _get_claude_client() -> httpx.AsyncClient:
+    """Return the shared Claude API client, creating it on first use"""
+    global _claude_client
+    if _claude_client is None:
+        _claude_client = httpx.AsyncClient(http2=True, timeout=60.0)
+    return _claude_client
+
+
+def _get_github_gate() -> asyncio.Semaphore:
+    """Return the GitHub concurrency gate for the running event loop"""
+    global _github_gate, _github_gate_loop
+    loop = asyncio.get_running_loop()
+    if _github_gate is None or _github_gate_loop is not loop:
+        _github_gate = asyncio.Semaphore(GITHUB_CONCURRENCY)
+        _github_gate_loop = loop
+    return _github_gate
+
+
+async def close_clients():
+    """Close the shared clients; registered as a shutdown handler"""
+    global _github_client, _claude_client, _github_gate, _github_gate_loop
+    for client in (_github_client, _claude_client):
+        if client is not None:
+            await client.aclose()
+    _github_client = _claude_client = None
+    _github_gate = _github_gate_loop = None
+
+
+# (url, token) -> (ETag, body) of the last 200 response, for conditional GETs
+_etag_cache: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+
+
+# (url, token) -> response future of a GET currently on the wire
+_inflight: Dict[Tuple[str, str], "asyncio.Future[httpx.Response]"] = {}
+
+
+def _retry_after_seconds(value: str) -> Optional[float]:
+    """Parse Retry-After as delay-seconds or an HTTP-date; None if neither"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _rate_limit_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited response, None otherwise"""
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        delay = _retry_after_seconds(retry_after)
+        if delay is not None:
+            return delay
+    if response.headers.get("x-ratelimit-remaining") == "0":
+        reset = response.headers.get("x-ratelimit-reset")
+        if reset is not None:
+            try:
+                return max(0.0, float(reset) - time.time())
+            except ValueError:
+                pass
+    if response.status_code == 403:
+        # A 403 with no rate-limit hints is a permissions error
+        return None
+    return 2**attempt * (1 + random.random())
+
+
+def _config_mtime_ns() -> Optional[int]:
+    """Modification time of the config file, or None if it cannot be read"""
+    try:
+        return CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _read_config(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse the config file; mtime_ns is part of the key so edits are picked up"""
+    return orjson.loads(path.read_bytes())
+
+
+def _write_config(config: Dict[str, Any]):
+    """
+    Replace the config file atomically
+
+    The new content is written and fsynced to a temp file that is then
+    renamed over the config, so readers never see a half-written file.
+    """
+    tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CONFIG_PATH)
+    _read_config.cache_clear()
+
 
 def retry_on_rate_limit(max_retries: int = 3, base_delay: float = 2.0):
     """Decorator to retry on rate limit with exponential backoff"""
@@ -33,7 +187,10 @@ def retry_on_rate_limit(max_retries: int = 3, base_delay: float = 2.0):
                         if attempt < max_retries - 1:
                             delay = base_delay * (2**attempt)
                             logger.warning(
-                                f"Rate limit hit, retrying in {delay}s... (attempt {attempt + 1}/{max_retries})"
+                                "Rate limit hit, retrying in %ss... (attempt %d/%d)",
+                                delay,
+                                attempt + 1,
+                                max_retries,
                             )
                             await asyncio.sleep(delay)
                             continue
@@ -42,7 +199,11 @@ def retry_on_rate_limit(max_retries: int = 3, base_delay: float = 2.0):
                     if attempt < max_retries - 1:
                         delay = base_delay * (2**attempt)
                         logger.warning(
-                            f"Request error: {e}, retrying in {delay}s... (attempt {attempt + 1}/{max_retries})"
+                            "Request error: %s, retrying in %ss... (attempt %d/%d)",
+                            e,
+                            delay,
+                            attempt + 1,
+                            max_retries,
                         )
                         await asyncio.sleep(delay)
                         continue
@@ -60,7 +221,9 @@ class MultiRepoSyncService:
     def __init__(self, github_token: str = None, claude_api_key: str = None):
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
         self.claude_api_key = claude_api_key or os.getenv("ANTHROPIC_API_KEY")
+        self._config_mtime_ns = _config_mtime_ns()
         self.config = self._load_config()
+        self._enabled_repos = self._collect_enabled_repos()
         self.base_url = "https://api.github.com"
         self.headers = {
             "Authorization": f"token {self.github_token}",
@@ -69,15 +232,10 @@ class MultiRepoSyncService:
 
     def _load_config(self) -> Dict[str, Any]:
         """Load multi-repo configuration"""
-        config_path = (
-            Path(__file__).parent.parent.parent.parent / "kova_repos_config.json"
-        )
-
         try:
-            with open(config_path, "r") as f:
-                return json.load(f)
+            return _read_config(CONFIG_PATH, self._config_mtime_ns)
         except Exception as e:
-            logger.error(f"Failed to load config: {e}")
+            logger.error("Failed to load config: %s", e)
             return self._get_default_config()
 
     def _get_default_config(self) -> Dict[str, Any]:
@@ -94,13 +252,126 @@ class MultiRepoSyncService:
             ],
         }
 
-    def get_enabled_repos(self) -> List[str]:
-        """Get list of enabled repositories"""
-        return [
+    def get_enabled_repos(self) -> Tuple[str, ...]:
+        """Get enabled repositories, reloading the config if the file changed"""
+        mtime_ns = _config_mtime_ns()
+        if mtime_ns != self._config_mtime_ns:
+            self._config_mtime_ns = mtime_ns
+            self.config = self._load_config()
+            self._enabled_repos = self._collect_enabled_repos()
+        return self._enabled_repos
+
+    def _collect_enabled_repos(self) -> Tuple[str, ...]:
+        """Full names of the repositories enabled in the current config"""
+        return tuple(
             repo["full_name"]
             for repo in self.config.get("repositories", [])
             if repo.get("enabled", True)
-        ]
+        )
+
+    async def _get(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """
+        GET a GitHub URL, sharing the round trip with an identical GET already
+        in flight, so overlapping syncs and status checks hit GitHub once.
+        """
+        key = (url, self.github_token or "")
+        shared = _inflight.get(key)
+        if shared is not None:
+            try:
+                # Shield so a cancelled follower does not cancel the leader
+                return await asyncio.shield(shared)
+            except asyncio.CancelledError:
+                # Retry on our own if only the leading caller was cancelled
+                if not shared.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self._get(client, url)
+
+        shared = asyncio.get_running_loop().create_future()
+        _inflight[key] = shared
+        try:
+            response = await self._revalidated_get(client, url)
+        except asyncio.CancelledError:
+            shared.cancel()
+            raise
+        except Exception as e:
+            shared.set_exception(e)
+            # Mark retrieved; the error is re-raised to this caller below
+            shared.exception()
+            raise
+        else:
+            shared.set_result(response)
+            return response
+        finally:
+            _inflight.pop(key, None)
+
+    async def _revalidated_get(
+        self, client: httpx.AsyncClient, url: str
+    ) -> httpx.Response:
+        """
+        GET a GitHub URL, revalidating with the last ETag seen for it
+
+        A 304 is turned back into a 200 carrying the cached body, so callers
+        handle both the same way; GitHub does not charge 304s to the rate limit.
+        """
+        key = (url, self.github_token or "")
+        cached = _etag_cache.get(key)
+        headers = self.headers
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+        response = await self._gated_get(client, url, headers)
+
+        if response.status_code == 304 and cached is not None:
+            return httpx.Response(200, content=cached[1], request=response.request)
+
+        etag = response.headers.get("etag")
+        if response.status_code == 200 and etag:
+            _etag_cache[key] = (etag, response.content)
+        return response
+
+    async def _gated_get(
+        self, client: httpx.AsyncClient, url: str, headers: Dict[str, str]
+    ) -> httpx.Response:
+        """
+        GET under the shared concurrency gate, honouring GitHub rate limits
+
+        Rate-limited responses are retried after Retry-After or the limit
+        reset, falling back to jittered exponential backoff. When the limit
+        is nearly spent, later requests wait for the reset up front.
+        """
+        global _rate_limit_pause_until
+        for attempt in range(RATE_LIMIT_RETRIES):
+            pause = _rate_limit_pause_until - time.time()
+            if 0 < pause <= MAX_RATE_LIMIT_WAIT:
+                await asyncio.sleep(pause)
+
+            async with _get_github_gate():
+                response = await client.get(url, headers=headers)
+
+            remaining = response.headers.get("x-ratelimit-remaining")
+            reset = response.headers.get("x-ratelimit-reset")
+            if remaining is not None and reset is not None:
+                try:
+                    if int(remaining) < RATE_LIMIT_LOW_WATER:
+                        _rate_limit_pause_until = float(reset)
+                except ValueError:
+                    # Malformed rate-limit headers; skip the proactive pause
+                    pass
+
+            delay = _rate_limit_delay(response, attempt)
+            if (
+                delay is None
+                or delay > MAX_RATE_LIMIT_WAIT
+                or attempt == RATE_LIMIT_RETRIES - 1
+            ):
+                return response
+            logger.warning(
+                "Rate limited on %s, retrying in %.1fs (attempt %d/%d)",
+                url,
+                delay,
+                attempt + 1,
+                RATE_LIMIT_RETRIES,
+            )
+            await asyncio.sleep(delay)
 
     async def sync_all_repositories(self) -> Dict[str, Any]:
         """Sync all enabled repositories"""
@@ -109,23 +380,27 @@ class MultiRepoSyncService:
         repos = self.get_enabled_repos()
         results = {}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for repo_full_name in repos:
-                try:
-                    logger.info(f"Syncing {repo_full_name}...")
-                    repo_data = await self._sync_single_repo(client, repo_full_name)
-                    results[repo_full_name] = {
-                        "status": "success",
-                        "data": repo_data,
-                        "synced_at": datetime.now().isoformat(),
-                    }
-                except Exception as e:
-                    logger.error(f"Failed to sync {repo_full_name}: {e}")
-                    results[repo_full_name] = {
-                        "status": "error",
-                        "error": str(e),
-                        "synced_at": datetime.now().isoformat(),
-                    }
+        # Repos are independent, so fetch them all at once
+        client = _get_github_client()
+        outcomes = await asyncio.gather(
+            *[self._sync_single_repo(client, repo) for repo in repos],
+            return_exceptions=True,
+        )
+
+        for repo_full_name, outcome in zip(repos, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to sync %s: %s", repo_full_name, outcome)
+                results[repo_full_name] = {
+                    "status": "error",
+                    "error": str(outcome),
+                    "synced_at": _now_iso(),
+                }
+            else:
+                results[repo_full_name] = {
+                    "status": "success",
+                    "data": outcome,
+                    "synced_at": _now_iso(),
+                }
 
         logger.info("Multi-repo sync completed")
         return results
@@ -135,9 +410,13 @@ class MultiRepoSyncService:
         self, client: httpx.AsyncClient, repo_full_name: str
     ) -> Dict[str, Any]:
         """Sync a single repository with retry logic"""
-        # Get repo info
-        repo_response = await client.get(
-            f"{self.base_url}/repos/{repo_full_name}", headers=self.headers
+        # Repo info, recent commits and branches are independent, so request
+        # them together and handle a missing repo once they are back
+        repo_url = f"{self.base_url}/repos/{repo_full_name}"
+        repo_response, commits_response, branches_response = await asyncio.gather(
+            self._get(client, repo_url),
+            self._get(client, f"{repo_url}/commits?per_page=5"),
+            self._get(client, f"{repo_url}/branches"),
         )
 
         if repo_response.status_code == 404:
@@ -147,21 +426,17 @@ class MultiRepoSyncService:
             }
 
         repo_response.raise_for_status()
-        repo_data = repo_response.json()
+        repo_data = orjson.loads(repo_response.content)
 
-        # Get recent commits
-        commits_response = await client.get(
-            f"{self.base_url}/repos/{repo_full_name}/commits?per_page=5",
-            headers=self.headers,
-        )
-        commits = commits_response.json() if commits_response.status_code == 200 else []
-
-        # Get branches
-        branches_response = await client.get(
-            f"{self.base_url}/repos/{repo_full_name}/branches", headers=self.headers
+        commits = (
+            orjson.loads(commits_response.content)
+            if commits_response.status_code == 200
+            else []
         )
         branches = (
-            branches_response.json() if branches_response.status_code == 200 else []
+            orjson.loads(branches_response.content)
+            if branches_response.status_code == 200
+            else []
         )
 
         return {
@@ -177,6 +452,37 @@ class MultiRepoSyncService:
             "forks": repo_data.get("forks_count", 0),
         }
 
+    async def _paginate(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the items of a paginated GitHub listing, following Link headers
+
+        The next page is requested while the current one is being consumed,
+        and is cancelled if the caller stops early. Stops at the first
+        non-200 page.
+        """
+        client = _get_github_client()
+        pending = asyncio.ensure_future(self._gated_get(client, url, self.headers))
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+                if response.status_code != 200:
+                    logger.error(
+                        "Failed to fetch %s: %s", response.url, response.status_code
+                    )
+                    return
+
+                next_url = response.links.get("next", {}).get("url")
+                if next_url:
+                    pending = asyncio.ensure_future(
+                        self._gated_get(client, next_url, self.headers)
+                    )
+                for item in orjson.loads(response.content):
+                    yield item
+        finally:
+            if pending is not None:
+                pending.cancel()
+
     async def discover_new_repos(self) -> List[str]:
         """Auto-discover new Kova AI repositories"""
         logger.info("Discovering new Kova AI repositories...")
@@ -186,71 +492,55 @@ class MultiRepoSyncService:
             "repo_name_pattern", "kova"
         )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.base_url}/users/{owner}/repos?per_page=100",
-                headers=self.headers,
+        # Filter for Kova-related repos across every page of the listing
+        kova_repos = [
+            repo["full_name"]
+            async for repo in self._paginate(
+                f"{self.base_url}/users/{owner}/repos?per_page=100"
             )
+            if pattern.lower() in repo["name"].lower()
+        ]
 
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch repos: {response.status_code}")
-                return []
-
-            all_repos = response.json()
-
-            # Filter for Kova-related repos
-            kova_repos = [
-                repo["full_name"]
-                for repo in all_repos
-                if pattern.lower() in repo["name"].lower()
-            ]
+        # Find new repos not in config
+        known_repos = set(self.get_enabled_repos())
+        new_repos = [repo for repo in kova_repos if repo not in known_repos]
 
-            # Find new repos not in config
-            known_repos = set(self.get_enabled_repos())
-            new_repos = [repo for repo in kova_repos if repo not in known_repos]
+        if new_repos:
+            logger.info("Discovered %s new repos: %s", len(new_repos), new_repos)
+        else:
+            logger.info("No new repos discovered")
 
-            if new_repos:
-                logger.info(f"Discovered {len(new_repos)} new repos: {new_repos}")
-            else:
-                logger.info("No new repos discovered")
-
-            return new_repos
+        return new_repos
 
     async def add_repo_to_config(
         self, repo_full_name: str, repo_type: str = "service"
     ) -> bool:
         """Add a new repository to the configuration"""
-        config_path = (
-            Path(__file__).parent.parent.parent.parent / "kova_repos_config.json"
-        )
-
         try:
             # Check if repo exists on GitHub
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/repos/{repo_full_name}", headers=self.headers
-                )
-
-                if response.status_code == 404:
-                    logger.warning(f"Repository {repo_full_name} not found on GitHub")
-                    # Still add it as planned
-                    repo_info = {
-                        "name": repo_full_name.split("/")[-1],
-                        "description": "Planned repository",
-                    }
-                else:
-                    repo_info = response.json()
+            response = await self._get(
+                _get_github_client(), f"{self.base_url}/repos/{repo_full_name}"
+            )
+
+            if response.status_code == 404:
+                logger.warning("Repository %s not found on GitHub", repo_full_name)
+                # Still add it as planned
+                repo_info = {
+                    "name": repo_full_name.split("/")[-1],
+                    "description": "Planned repository",
+                }
+            else:
+                repo_info = orjson.loads(response.content)
 
             # Load current config
-            with open(config_path, "r") as f:
-                config = json.load(f)
+            config = orjson.loads(CONFIG_PATH.read_bytes())
 
             # Check if already exists
             existing = [
                 r for r in config["repositories"] if r["full_name"] == repo_full_name
             ]
             if existing:
-                logger.info(f"Repository {repo_full_name} already in config")
+                logger.info("Repository %s already in config", repo_full_name)
                 return True
 
             # Add new repo
@@ -267,14 +557,13 @@ class MultiRepoSyncService:
             config["repositories"].append(new_repo)
 
             # Save updated config
-            with open(config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            _write_config(config)
 
-            logger.info(f"Added {repo_full_name} to config")
+            logger.info("Added %s to config", repo_full_name)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to add repo to config: {e}")
+            logger.error("Failed to add repo to config: %s", e)
             return False
 
     async def sync_with_claude(self, repo_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -294,34 +583,33 @@ class MultiRepoSyncService:
             "messages": [
                 {
                     "role": "user",
-                    "content": f"Analyze this Kova AI repository data:\n\n{json.dumps(repo_data, indent=2)}",
+                    "content": f"Analyze this Kova AI repository data:\n\n{orjson.dumps(repo_data).decode()}",
                 }
             ],
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    "https://api.anthropic.com/v1/messages",
-                    headers=headers,
-                    json=payload,
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    return {
-                        "status": "success",
-                        "analysis": result.get("content", [{}])[0].get(
-                            "text", "No response"
-                        ),
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "error": f"Claude API returned {response.status_code}",
-                    }
+            response = await _get_claude_client().post(
+                "https://api.anthropic.com/v1/messages",
+                headers=headers,
+                content=orjson.dumps(payload),
+            )
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return {
+                    "status": "success",
+                    "analysis": result.get("content", [{}])[0].get(
+                        "text", "No response"
+                    ),
+                }
+            else:
+                return {
+                    "status": "error",
+                    "error": f"Claude API returned {response.status_code}",
+                }
         except Exception as e:
-            logger.error(f"Failed to sync with Claude: {e}")
+            logger.error("Failed to sync with Claude: %s", e)
             return {"status": "error", "error": str(e)}
 
     async def get_cross_repo_status(self) -> Dict[str, Any]:
@@ -331,31 +619,34 @@ class MultiRepoSyncService:
         status = {
             "total_repos": len(repos),
             "repos": {},
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for repo_full_name in repos:
-                try:
-                    response = await client.get(
-                        f"{self.base_url}/repos/{repo_full_name}", headers=self.headers
-                    )
+        client = _get_github_client()
+        responses = await asyncio.gather(
+            *[self._get(client, f"{self.base_url}/repos/{repo}") for repo in repos],
+            return_exceptions=True,
+        )
 
-                    if response.status_code == 200:
-                        repo_data = response.json()
-                        status["repos"][repo_full_name] = {
-                            "exists": True,
-                            "updated_at": repo_data.get("updated_at"),
-                            "default_branch": repo_data.get("default_branch"),
-                            "open_issues": repo_data.get("open_issues_count", 0),
-                        }
-                    else:
-                        status["repos"][repo_full_name] = {
-                            "exists": False,
-                            "status": "not_found_or_planned",
-                        }
-                except Exception as e:
-                    status["repos"][repo_full_name] = {"exists": False, "error": str(e)}
+        for repo_full_name, response in zip(repos, responses):
+            if isinstance(response, Exception):
+                status["repos"][repo_full_name] = {
+                    "exists": False,
+                    "error": str(response),
+                }
+            elif response.status_code == 200:
+                repo_data = orjson.loads(response.content)
+                status["repos"][repo_full_name] = {
+                    "exists": True,
+                    "updated_at": repo_data.get("updated_at"),
+                    "default_branch": repo_data.get("default_branch"),
+                    "open_issues": repo_data.get("open_issues_count", 0),
+                }
+            else:
+                status["repos"][repo_full_name] = {
+                    "exists": False,
+                    "status": "not_found_or_planned",
+                }
 
         return status
 
@@ -372,6 +663,7 @@ async def main():
     # Sync all repos
     print("\nSyncing all repositories...")
     results = await service.sync_all_repositories()
+    await close_clients()
 
     for repo, result in results.items():
         status = result.get("status")
@@ -23,12 +23,21 @@ CREATE INDEX IF NOT EXISTS idx_repository_name ON repository(name);
 CREATE INDEX IF NOT EXISTS idx_repository_full_name ON repository(full_name);
 CREATE INDEX IF NOT EXISTS idx_repository_status ON repository(status);
 
+-- Error severity levels (values match models.ErrorSeverity)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'severity_enum') THEN
+        CREATE TYPE severity_enum AS ENUM ('low', 'medium', 'high', 'critical');
+    END IF;
+END
+$$;
+
 -- Error Table
 CREATE TABLE IF NOT EXISTS error (
     id SERIAL PRIMARY KEY,
     repository_id INTEGER REFERENCES repository(id) ON DELETE CASCADE,
     error_type VARCHAR(100),
-    severity VARCHAR(50),
+    severity severity_enum,
     message TEXT NOT NULL,
     stack_trace TEXT,
     file_path VARCHAR(500),
@@ -39,10 +48,38 @@ CREATE TABLE IF NOT EXISTS error (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Migrate databases created before severity_enum: the column was VARCHAR
+-- holding critical/error/warning/info. Map those onto the new levels and
+-- null anything unrecognised. No-op once the column is already the enum.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'error' AND column_name = 'severity'
+          AND data_type <> 'USER-DEFINED'
+    ) THEN
+        ALTER TABLE error ALTER COLUMN severity TYPE severity_enum USING (
+            CASE lower(severity)
+                WHEN 'critical' THEN 'critical'
+                WHEN 'high' THEN 'high'
+                WHEN 'error' THEN 'high'
+                WHEN 'medium' THEN 'medium'
+                WHEN 'warning' THEN 'medium'
+                WHEN 'low' THEN 'low'
+                WHEN 'info' THEN 'low'
+            END
+        )::severity_enum;
+    END IF;
+END
+$$;
+
 CREATE INDEX IF NOT EXISTS idx_error_created_at ON error(created_at);
 CREATE INDEX IF NOT EXISTS idx_error_repository_id ON error(repository_id);
 CREATE INDEX IF NOT EXISTS idx_error_type ON error(error_type);
 CREATE INDEX IF NOT EXISTS idx_error_resolved ON error(resolved);
+-- Open errors per repository: WHERE repository_id = ? AND resolved = false
+CREATE INDEX IF NOT EXISTS ix_error_repository_resolved ON error(repository_id, resolved);
+CREATE INDEX IF NOT EXISTS idx_error_severity ON error(severity);
 
 -- Sync Log Table
 CREATE TABLE IF NOT EXISTS sync_log (
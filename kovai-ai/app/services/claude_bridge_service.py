@@ -1,8 +1,11 @@
 import os
-import json
 import logging
 import asyncio
+import signal
+import time
 import httpx
+import orjson
+from contextlib import suppress
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -15,13 +18,12 @@ def load_kova_repos():
     """Load Kova repositories from config file"""
     config_path = Path(__file__).parent.parent.parent.parent / "kova_repos_config.json"
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-            return [
-                repo["full_name"]
-                for repo in config.get("repositories", [])
-                if repo.get("enabled", True)
-            ]
+        config = orjson.loads(config_path.read_bytes())
+        return [
+            repo["full_name"]
+            for repo in config.get("repositories", [])
+            if repo.get("enabled", True)
+        ]
     except Exception:
         # Fallback to default list
         return [
@@ -39,70 +41,78 @@ KOVA_REPOS = load_kova_repos()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def sync_repositories():
-    while True:
+SYNC_INTERVAL = 300  # Seconds between the starts of two sync cycles
+
+async def sync_repositories(client, stop):
+    while not stop.is_set():
+        started = time.monotonic()
         try:
-            logger.info(f"Starting synchronization at {datetime.now()}")
-            for repo in KOVA_REPOS:
-                await sync_repo(repo)
-            logger.info(f"Synchronization completed at {datetime.now()}")
+            logger.info("Starting synchronization at %s", datetime.now())
+            await asyncio.gather(
+                *(sync_repo(client, repo) for repo in KOVA_REPOS),
+                return_exceptions=True
+            )
+            logger.info("Synchronization completed at %s", datetime.now())
         except Exception as e:
-            logger.error(f"Error during synchronization: {e}")
-        await asyncio.sleep(300)  # Wait for 5 minutes
+            logger.error("Error during synchronization: %s", e)
+        # Sleep out the rest of the interval so cycles keep a fixed cadence
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                stop.wait(), max(0, SYNC_INTERVAL - (time.monotonic() - started))
+            )
 
-async def sync_repo(repo):
+async def sync_repo(client, repo):
     """Sync a single repository with GitHub and Claude"""
-    logger.info(f"Syncing repository: {repo}")
+    logger.info("Syncing repository: %s", repo)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Fetch repo data from GitHub
-            headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-
-            # Get basic repo info
-            repo_response = await client.get(
-                f"https://api.github.com/repos/{repo}",
-                headers=headers
-            )
-
-            if repo_response.status_code == 404:
-                logger.warning(f"Repository {repo} not found - may need to be created")
-                return {"status": "not_found", "repo": repo}
-
-            repo_data = repo_response.json()
-
-            # Get recent commits
-            commits_response = await client.get(
-                f"https://api.github.com/repos/{repo}/commits?per_page=5",
-                headers=headers
-            )
-            commits = commits_response.json() if commits_response.status_code == 200 else []
-
-            sync_data = {
-                "repo": repo,
-                "name": repo_data.get("name"),
-                "updated_at": repo_data.get("updated_at"),
-                "recent_commits": len(commits),
-                "default_branch": repo_data.get("default_branch"),
-                "status": "synced"
-            }
-
-            # Send to Claude for analysis
-            if CLAUDE_API_KEY:
-                await communicate_with_claude_api(sync_data)
-
-            logger.info(f"Successfully synced {repo}")
-            return sync_data
+        # Fetch repo data from GitHub
+        headers = {"Authorization": f"token {GITHUB_TOKEN}"}
+
+        # Get basic repo info
+        repo_response = await client.get(
+            f"https://api.github.com/repos/{repo}",
+            headers=headers
+        )
+
+        if repo_response.status_code == 404:
+            logger.warning("Repository %s not found - may need to be created", repo)
+            return {"status": "not_found", "repo": repo}
+
+        repo_data = orjson.loads(repo_response.content)
+
+        # Get recent commits
+        commits_response = await client.get(
+            f"https://api.github.com/repos/{repo}/commits?per_page=5",
+            headers=headers
+        )
+        commits = orjson.loads(commits_response.content) if commits_response.status_code == 200 else []
+
+        sync_data = {
+            "repo": repo,
+            "name": repo_data.get("name"),
+            "updated_at": repo_data.get("updated_at"),
+            "recent_commits": len(commits),
+            "default_branch": repo_data.get("default_branch"),
+            "status": "synced"
+        }
+
+        # Send to Claude for analysis
+        if CLAUDE_API_KEY:
+            await communicate_with_claude_api(client, sync_data)
+
+        logger.info("Successfully synced %s", repo)
+        return sync_data
 
     except Exception as e:
-        logger.error(f"Error syncing {repo}: {e}")
+        logger.error("Error syncing %s: %s", repo, e)
         return {"status": "error", "repo": repo, "error": str(e)}
 
-async def manual_sync():
-    for repo in KOVA_REPOS:
-        await sync_repo(repo)
+async def manual_sync(client):
+    # sync_repo catches its own errors, so the repos can run side by side
+    return await asyncio.gather(*[sync_repo(client, repo) for repo in KOVA_REPOS])
 
-async def communicate_with_claude_api(data):
+async def communicate_with_claude_api(client, data):
     """Communicate with Claude API using correct Anthropic endpoint"""
     if not CLAUDE_API_KEY:
         logger.warning("Claude API key not configured - skipping Claude sync")
@@ -119,40 +129,53 @@ async def communicate_with_claude_api(data):
         "max_tokens": 1024,
         "messages": [{
             "role": "user",
-            "content": f"Analyze this Kova AI repository sync data:\n\n{json.dumps(data, indent=2)}\n\nProvide a brief summary of the repository status."
+            "content": f"Analyze this Kova AI repository sync data:\n\n{orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}\n\nProvide a brief summary of the repository status."
         }]
     }
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                'https://api.anthropic.com/v1/messages',
-                headers=headers,
-                json=payload
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "status": "success",
-                    "analysis": result.get("content", [{}])[0].get("text", "No response")
-                }
-            else:
-                logger.error(f"Claude API error: {response.status_code} - {response.text}")
-                return {
-                    "status": "error",
-                    "error": f"API returned {response.status_code}"
-                }
+        response = await client.post(
+            'https://api.anthropic.com/v1/messages',
+            headers=headers,
+            content=orjson.dumps(payload),
+            timeout=60.0
+        )
+
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            return {
+                "status": "success",
+                "analysis": result.get("content", [{}])[0].get("text", "No response")
+            }
+        else:
+            logger.error("Claude API error: %s - %s", response.status_code, response.text)
+            return {
+                "status": "error",
+                "error": f"API returned {response.status_code}"
+            }
     except Exception as e:
-        logger.error(f"Failed to communicate with Claude API: {e}")
+        logger.error("Failed to communicate with Claude API: %s", e)
         return {"status": "error", "error": str(e)}
 
-if __name__ == "__main__":
-    loop = asyncio.get_event_loop()
-    try:
-        loop.run_until_complete(sync_repositories())
-    except KeyboardInterrupt:
+def create_client():
+    """One client for the whole run; auth headers are passed per request"""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=200)
+    )
+
+async def main():
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop.set)
+
+    async with create_client() as client:
+        await sync_repositories(client, stop)
         logger.info("Manual sync initiated")
-        loop.run_until_complete(manual_sync())
-    finally:
-        loop.close()
\ No newline at end of file
+        await manual_sync(client)
+
+if __name__ == "__main__":
+    asyncio.run(main())
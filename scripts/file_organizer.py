@@ -7,14 +7,17 @@ the analysis from gdrive_import.py or local file scanning.
 """
 
 import os
+import sys
+import errno
 import json
+import logging
 import shutil
-import hashlib
 import re
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import argparse
+from functools import lru_cache
 
 
 class Colors:
@@ -29,6 +32,33 @@ class Colors:
     BOLD = '\033[1m'
 
 
+logger = logging.getLogger('kova.file_organizer')
+
+
+class ColorFormatter(logging.Formatter):
+    """Wrap each message in the ANSI color passed as extra={'color': ...}"""
+
+    def __init__(self, use_color: bool = True):
+        super().__init__()
+        self.use_color = use_color
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not self.use_color:
+            return record.getMessage()
+        color = getattr(record, 'color', Colors.RESET)
+        return f"{color}{record.getMessage()}{Colors.RESET}"
+
+
+def setup_logging(quiet: bool = False):
+    """Send organizer output to stdout; quiet drops the per-file lines"""
+    handler = logging.StreamHandler(sys.stdout)
+    # Colors only help on a terminal; keep redirected output plain
+    handler.setFormatter(ColorFormatter(use_color=sys.stdout.isatty()))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO if quiet else logging.DEBUG)
+    logger.propagate = False
+
+
 # Folder structure mapping
 FOLDER_STRUCTURE = {
     'CORE': '01-Core-System',
@@ -74,6 +104,137 @@ SUBCATEGORIES = {
     }
 }
 
+# Destination subfolder rules per category, checked in order against the
+# lowercased file name; the first keyword found picks the subfolder
+SUBCATEGORY_RULES = {
+    'CORE': (
+        ('architecture', 'Documentation/Architecture'),
+        ('diagram', 'Documentation/Architecture'),
+        ('api', 'Documentation/API-Reference'),
+        ('endpoint', 'Documentation/API-Reference'),
+        ('setup', 'Documentation/Setup-Guides'),
+        ('guide', 'Documentation/Setup-Guides'),
+        ('config', 'Configuration/Production'),
+        ('env', 'Configuration/Production'),
+        ('docker', 'Deployment/Docker'),
+    ),
+    'INT': (
+        ('google', 'Google-Drive/Scripts'),
+        ('drive', 'Google-Drive/Scripts'),
+        ('claude', 'Claude-AI/Prompts'),
+        ('anthropic', 'Claude-AI/Prompts'),
+        ('github', 'GitHub/Webhooks'),
+        ('webhook', 'GitHub/Webhooks'),
+        ('appsheet', 'AppSheet/Apps'),
+    ),
+    'DATA': (
+        ('backup', 'Backups/Daily'),
+        ('archive', 'Archives/2024'),
+    ),
+    'DEV': (
+        ('prototype', 'Prototypes'),
+        ('proto', 'Prototypes'),
+        ('experiment', 'Experiments'),
+        ('test', 'Experiments'),
+    ),
+}
+
+# Subfolder used when no rule matches; categories not listed stay at the top
+DEFAULT_SUBCATEGORY = {
+    'DATA': 'Active-Data/Databases',
+    'DEV': 'Active-Projects',
+}
+
+# Filename cleanup patterns, compiled once. Any run of characters outside
+# [a-zA-Z0-9] (hyphens included) collapses to a single hyphen in one pass.
+DESC_CLEAN_RE = re.compile(r'[^a-zA-Z0-9]+')
+VERSION_RE = re.compile(r'v?(\d+)\.(\d+)')
+
+
+# Read size for the byte-by-byte comparison in same_content
+COMPARE_CHUNK_SIZE = 1 << 20
+
+
+def same_content(path1: Path, path2: Path) -> bool:
+    """True if both files hold identical bytes; sizes are compared before reading"""
+    if path1.stat().st_size != path2.stat().st_size:
+        return False
+    # A direct comparison needs no hashing and stops at the first difference
+    with open(path1, 'rb') as f1, open(path2, 'rb') as f2:
+        while True:
+            chunk = f1.read(COMPARE_CHUNK_SIZE)
+            if chunk != f2.read(COMPARE_CHUNK_SIZE):
+                return False
+            if not chunk:
+                return True
+
+
+def move_file(source: Path, destination: Path):
+    """Move a file with a single rename, copying only across filesystems"""
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(destination))
+
+
+# Revisions and duplicates repeat the same names, so the naming and routing
+# rules below are memoized on their inputs
+@lru_cache(maxsize=4096)
+def standard_filename(date: str, category: str, name: str, name_lower: str) -> str:
+    """Standardized filename: date_category_project_description_version.ext"""
+    # Get project (from keywords or name)
+    project = 'Kova-AI'  # Default
+    if 'mem0' in name_lower:
+        project = 'Kova-Mem0'
+    elif 'site' in name_lower:
+        project = 'Kova-Site'
+    elif 'docengine' in name_lower:
+        project = 'Kova-DocEngine'
+    elif 'multi-repo' in name_lower or 'multirepo' in name_lower:
+        project = 'Multi-Repo'
+
+    # Get description (clean filename)
+    path = Path(name)
+    desc = DESC_CLEAN_RE.sub('-', path.stem)
+    desc = desc.strip('-')[:50]  # Max 50 chars
+
+    # Get extension
+    ext = path.suffix
+
+    # Get version
+    version = 'v1.0'
+    if 'draft' in name_lower:
+        version = 'draft'
+    elif 'final' in name_lower:
+        version = 'final'
+    else:
+        # Try to extract version
+        version_match = VERSION_RE.search(name)
+        if version_match:
+            version = f"v{version_match.group(1)}.{version_match.group(2)}"
+
+    return f"{date}_{category}_{project}_{desc}_{version}{ext}"
+
+
+@lru_cache(maxsize=4096)
+def destination_folder(category: str, name_lower: str) -> str:
+    """Destination folder for a file, relative to the hub root"""
+    # Get base category folder
+    base_folder = FOLDER_STRUCTURE.get(category, FOLDER_STRUCTURE['UNKNOWN'])
+
+    # Determine subcategory
+    subcategory = DEFAULT_SUBCATEGORY.get(category)
+    for keyword, folder in SUBCATEGORY_RULES.get(category, ()):
+        if keyword in name_lower:
+            subcategory = folder
+            break
+
+    if subcategory:
+        return f"{base_folder}/{subcategory}"
+    return base_folder
+
 
 class FileOrganizer:
     """Organize files into Kova Master Hub structure"""
@@ -81,17 +242,23 @@ class FileOrganizer:
     def __init__(self, base_path: str, dry_run: bool = True):
         self.base_path = Path(base_path)
         self.dry_run = dry_run
-        self.stats = {
-            'processed': 0,
-            'moved': 0,
-            'renamed': 0,
-            'skipped': 0,
-            'errors': 0
-        }
-
-    def log(self, message: str, color: str = Colors.RESET):
-        """Print colored message"""
-        print(f"{color}{message}{Colors.RESET}")
+        # Absolute destination folders, built once per relative folder
+        self._dest_paths: Dict[str, Path] = {}
+        # Folders known to exist, so organize_file skips their mkdir
+        self._made_dirs = set()
+        self.review_path = self.base_path / FOLDER_STRUCTURE['UNKNOWN']
+        # Length of the base path prefix on joined paths ('' for '.', '/' for '/')
+        self._base_prefix_len = len(str(self.base_path / 'x')) - 1
+        # Counters reported by print_summary
+        self.processed = 0
+        self.moved = 0
+        self.renamed = 0
+        self.skipped = 0
+        self.errors = 0
+
+    def log(self, message: str, color: str = Colors.RESET, level: int = logging.INFO):
+        """Log a colored message; per-file lines use DEBUG so --quiet can drop them"""
+        logger.log(level, message, extra={'color': color})
 
     def create_folder_structure(self):
         """Create the Kova Master Hub folder structure"""
@@ -178,168 +345,112 @@ class FileOrganizer:
         ]
 
         created = 0
-        for folder in folders_to_create:
-            full_path = self.base_path / folder
-            if not self.dry_run:
-                full_path.mkdir(parents=True, exist_ok=True)
-                created += 1
-            else:
-                self.log(f"  Would create: {folder}", Colors.CYAN)
+        if self.dry_run:
+            for folder in folders_to_create:
+                self.log(f"  Would create: {folder}", Colors.CYAN, logging.DEBUG)
+        else:
+            # Only leaf folders need a mkdir; parents come with them. Longest
+            # first, so a folder that is a parent of one already made is skipped
+            made = set()
+            for folder in sorted(set(folders_to_create), key=len, reverse=True):
+                if folder in made:
+                    continue
+                full_path = self.base_path / folder
+                # A stat is cheaper than a failing mkdir on re-runs
+                if not full_path.is_dir():
+                    full_path.mkdir(parents=True, exist_ok=True)
+                    created += 1
+                made.update(str(parent) for parent in Path(folder).parents)
+                self._made_dirs.add(full_path)
 
         if not self.dry_run:
             self.log(f"✅ Created {created} folders", Colors.GREEN)
         else:
             self.log(f"  (Dry run: would create {len(folders_to_create)} folders)", Colors.YELLOW)
 
-    def generate_new_filename(self, file_info: Dict[str, Any]) -> str:
-        """Generate standardized filename"""
+    def generate_new_filename(self, file_info: Dict[str, Any], name_lower: Optional[str] = None) -> str:
+        """Generate standardized filename; name_lower is the lowercased name, if already known"""
         # Get date
         if 'modified' in file_info:
             date = file_info['modified'][:10]  # YYYY-MM-DD
         else:
             date = datetime.now().strftime('%Y-%m-%d')
 
-        # Get category
-        category = file_info.get('category', 'UNKNOWN')
-
-        # Get project (from keywords or name)
         name = file_info.get('name', 'file')
-        project = 'Kova-AI'  # Default
-        if 'mem0' in name.lower():
-            project = 'Kova-Mem0'
-        elif 'site' in name.lower():
-            project = 'Kova-Site'
-        elif 'docengine' in name.lower():
-            project = 'Kova-DocEngine'
-        elif 'multi-repo' in name.lower() or 'multirepo' in name.lower():
-            project = 'Multi-Repo'
-
-        # Get description (clean filename)
-        desc = Path(name).stem
-        desc = re.sub(r'[^a-zA-Z0-9-]', '-', desc)
-        desc = re.sub(r'-+', '-', desc)
-        desc = desc.strip('-')[:50]  # Max 50 chars
-
-        # Get extension
-        ext = Path(name).suffix
-
-        # Get version
-        version = 'v1.0'
-        if 'draft' in name.lower():
-            version = 'draft'
-        elif 'final' in name.lower():
-            version = 'final'
-        else:
-            # Try to extract version
-            version_match = re.search(r'v?(\d+)\.(\d+)', name)
-            if version_match:
-                version = f"v{version_match.group(1)}.{version_match.group(2)}"
-
-        # Construct filename
-        new_name = f"{date}_{category}_{project}_{desc}_{version}{ext}"
-
-        return new_name
-
-    def determine_destination(self, file_info: Dict[str, Any]) -> Path:
-        """Determine destination folder for file"""
-        category = file_info.get('category', 'UNKNOWN')
-        name = file_info.get('name', '').lower()
-
-        # Get base category folder
-        base_folder = FOLDER_STRUCTURE.get(category, FOLDER_STRUCTURE['UNKNOWN'])
-
-        # Determine subcategory
-        subcategory = None
-        if category == 'CORE':
-            if 'architecture' in name or 'diagram' in name:
-                subcategory = 'Documentation/Architecture'
-            elif 'api' in name or 'endpoint' in name:
-                subcategory = 'Documentation/API-Reference'
-            elif 'setup' in name or 'guide' in name:
-                subcategory = 'Documentation/Setup-Guides'
-            elif 'config' in name or 'env' in name:
-                subcategory = 'Configuration/Production'
-            elif 'docker' in name:
-                subcategory = 'Deployment/Docker'
-
-        elif category == 'INT':
-            if 'google' in name or 'drive' in name:
-                subcategory = 'Google-Drive/Scripts'
-            elif 'claude' in name or 'anthropic' in name:
-                subcategory = 'Claude-AI/Prompts'
-            elif 'github' in name or 'webhook' in name:
-                subcategory = 'GitHub/Webhooks'
-            elif 'appsheet' in name:
-                subcategory = 'AppSheet/Apps'
-
-        elif category == 'DATA':
-            if 'backup' in name:
-                subcategory = 'Backups/Daily'
-            elif 'archive' in name:
-                subcategory = 'Archives/2024'
-            else:
-                subcategory = 'Active-Data/Databases'
+        if name_lower is None:
+            name_lower = name.lower()
 
-        elif category == 'DEV':
-            if 'prototype' in name or 'proto' in name:
-                subcategory = 'Prototypes'
-            elif 'experiment' in name or 'test' in name:
-                subcategory = 'Experiments'
-            else:
-                subcategory = 'Active-Projects'
-
-        # Build full path
-        if subcategory:
-            destination = self.base_path / base_folder / subcategory
-        else:
-            destination = self.base_path / base_folder
+        return standard_filename(date, file_info.get('category', 'UNKNOWN'), name, name_lower)
 
-        return destination
+    def determine_destination(self, file_info: Dict[str, Any], name_lower: Optional[str] = None) -> Path:
+        """Determine destination folder for file; name_lower is the lowercased name, if already known"""
+        if name_lower is None:
+            name_lower = file_info.get('name', '').lower()
+        folder = destination_folder(file_info.get('category', 'UNKNOWN'), name_lower)
+        path = self._dest_paths.get(folder)
+        if path is None:
+            path = self._dest_paths[folder] = self.base_path / folder
+        return path
 
     def organize_file(self, file_info: Dict[str, Any], source_path: Optional[Path] = None):
         """Organize a single file"""
-        self.stats['processed'] += 1
+        self.processed += 1
+
+        # Both helpers match keywords against the lowercased name
+        name_lower = file_info.get('name', '').lower()
 
         # Determine destination
-        destination_folder = self.determine_destination(file_info)
+        destination_folder = self.determine_destination(file_info, name_lower)
 
         # Generate new filename
-        new_filename = self.generate_new_filename(file_info)
+        new_filename = self.generate_new_filename(file_info, name_lower)
 
         # Full destination path
         destination_path = destination_folder / new_filename
 
-        # Log action
-        if source_path:
-            action = f"Move: {source_path.name} -> {destination_path.relative_to(self.base_path)}"
-        else:
-            action = f"Would download: {file_info.get('name')} -> {destination_path.relative_to(self.base_path)}"
+        # Log action; per-file lines are DEBUG, so skip building it under --quiet
+        action = ''
+        if logger.isEnabledFor(logging.DEBUG):
+            # destination_path is always under base_path, so slice off the prefix
+            relative = str(destination_path)[self._base_prefix_len:]
+            if source_path:
+                action = f"Move: {source_path.name} -> {relative}"
+            else:
+                action = f"Would download: {file_info.get('name')} -> {relative}"
 
         # Check relevance score
         relevance = file_info.get('relevance_score', 5)
         if relevance < 5:
-            self.log(f"  ⚠️  Low relevance ({relevance}): {action}", Colors.YELLOW)
+            self.log(f"  ⚠️  Low relevance ({relevance}): {action}", Colors.YELLOW, logging.DEBUG)
             # Send to purgatory
-            destination_path = self.base_path / '09-Purgatory/To-Review/Needs-Categorization' / new_filename
+            destination_path = self.review_path / new_filename
 
         # Perform action
         if not self.dry_run and source_path:
             try:
-                destination_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(source_path), str(destination_path))
-                self.stats['moved'] += 1
-                self.log(f"  ✅ {action}", Colors.GREEN)
+                if destination_path.exists() and same_content(source_path, destination_path):
+                    self.skipped += 1
+                    self.log(f"  ⏭️  Identical file already organized: {action}", Colors.YELLOW, logging.DEBUG)
+                    return
+
+                parent = destination_path.parent
+                if parent not in self._made_dirs:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    self._made_dirs.add(parent)
+                move_file(source_path, destination_path)
+                self.moved += 1
+                self.log(f"  ✅ {action}", Colors.GREEN, logging.DEBUG)
             except Exception as e:
-                self.stats['errors'] += 1
-                self.log(f"  ❌ Error: {e}", Colors.RED)
+                self.errors += 1
+                self.log(f"  ❌ Error: {e}", Colors.RED, logging.ERROR)
         else:
-            self.log(f"  📝 {action}", Colors.CYAN)
+            self.log(f"  📝 {action}", Colors.CYAN, logging.DEBUG)
 
     def organize_from_inventory(self, inventory_file: Path):
         """Organize files based on inventory JSON"""
         self.log(f"\n📋 Loading inventory from: {inventory_file}", Colors.BOLD)
 
-        with open(inventory_file, 'r') as f:
+        with open(inventory_file, 'r', encoding='utf-8') as f:
             inventory = json.load(f)
 
         self.log(f"  Found {len(inventory)} files to organize", Colors.CYAN)
@@ -360,11 +471,11 @@ class FileOrganizer:
         self.log("📊 ORGANIZATION SUMMARY", Colors.BOLD)
         self.log("="*80, Colors.BOLD)
 
-        self.log(f"\n  Processed: {self.stats['processed']}", Colors.CYAN)
-        self.log(f"  Moved: {self.stats['moved']}", Colors.GREEN)
-        self.log(f"  Renamed: {self.stats['renamed']}", Colors.YELLOW)
-        self.log(f"  Skipped: {self.stats['skipped']}", Colors.YELLOW)
-        self.log(f"  Errors: {self.stats['errors']}", Colors.RED)
+        self.log(f"\n  Processed: {self.processed}", Colors.CYAN)
+        self.log(f"  Moved: {self.moved}", Colors.GREEN)
+        self.log(f"  Renamed: {self.renamed}", Colors.YELLOW)
+        self.log(f"  Skipped: {self.skipped}", Colors.YELLOW)
+        self.log(f"  Errors: {self.errors}", Colors.RED)
 
         if self.dry_run:
             self.log(f"\n⚠️  DRY RUN MODE - No files were actually moved", Colors.YELLOW)
@@ -402,8 +513,10 @@ def main():
     parser.add_argument('--inventory', help='Path to inventory JSON file from gdrive_import.py')
     parser.add_argument('--dry-run', action='store_true', help='Dry run mode (no actual changes)')
     parser.add_argument('--execute', action='store_true', help='Execute mode (actually move files)')
+    parser.add_argument('--quiet', action='store_true', help='Only print progress and the summary, not every file')
 
     args = parser.parse_args()
+    setup_logging(quiet=args.quiet)
 
     # Default to dry run unless --execute is specified
     dry_run = not args.execute
@@ -10,7 +10,8 @@ import os
 import json
 import hashlib
 import mimetypes
-from datetime import datetime
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import re
@@ -28,6 +29,11 @@ except ImportError:
     print("⚠️  Google Drive API not installed. Install with:")
     print("   pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Configuration
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
@@ -49,6 +55,23 @@ CATEGORIES = {
     'RES': ['tutorial', 'guide', 'reference', 'asset', 'template']
 }
 
+# All category keywords in one pattern, listed in category priority order.
+# The lookahead reports a match at every position, including overlapping ones,
+# and at each position the highest-priority keyword wins.
+KEYWORD_RANK = {}
+for rank, keywords in enumerate(CATEGORIES.values()):
+    for kw in keywords:
+        KEYWORD_RANK.setdefault(kw, rank)
+CATEGORY_NAMES = list(CATEGORIES)
+CATEGORY_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in KEYWORD_RANK) + '))'
+)
+
+WORD_RE = re.compile(r'\w+')
+
+# Names whose word sets have a Jaccard similarity above this are reported
+SIMILARITY_THRESHOLD = 0.8
+
 
 class Colors:
     """ANSI color codes"""
@@ -71,6 +94,8 @@ class GoogleDriveImporter:
         self.file_inventory = []
         self.duplicates = []
         self.categories = {}
+        # Reference time for file ages, so every file in a scan is aged alike
+        self.scan_time = datetime.now(timezone.utc)
 
     def log(self, message: str, color: str = Colors.RESET):
         """Print colored message"""
@@ -123,15 +148,21 @@ class GoogleDriveImporter:
         all_files = []
         page_token = None
 
+        # One OR-ed query, fetched in the largest pages Drive allows. Owners
+        # are trimmed to the two fields the inventory keeps; the full owner
+        # objects (photo links, permission ids) are never used.
+        query = ' or '.join([f"name contains '{kw}'" for kw in KOVA_KEYWORDS])
+
         try:
             while True:
                 # Search for files
-                query = ' or '.join([f"name contains '{kw}'" for kw in KOVA_KEYWORDS])
                 results = self.service.files().list(
                     q=query,
-                    pageSize=100,
+                    corpora='user',
+                    spaces='drive',
+                    pageSize=1000,
                     pageToken=page_token,
-                    fields="nextPageToken, files(id, name, mimeType, size, modifiedTime, createdTime, owners, parents, webViewLink)"
+                    fields="nextPageToken, files(id, name, mimeType, size, md5Checksum, modifiedTime, createdTime, owners(displayName, emailAddress), parents, webViewLink)"
                 ).execute()
 
                 files = results.get('files', [])
@@ -158,13 +189,16 @@ class GoogleDriveImporter:
         relevance_score = 0
 
         # Keyword matching (0-4 points)
-        keyword_matches = sum(1 for kw in KOVA_KEYWORDS if kw in name)
-        relevance_score += min(keyword_matches * 2, 4)
+        keywords_found = [kw for kw in KOVA_KEYWORDS if kw in name]
+        relevance_score += min(len(keywords_found) * 2, 4)
 
         # Recency (0-3 points)
         if 'modifiedTime' in file_info:
+            # fromisoformat only accepts a trailing 'Z' from Python 3.11 on
             modified = datetime.fromisoformat(file_info['modifiedTime'].replace('Z', '+00:00'))
-            days_old = (datetime.now(modified.tzinfo) - modified).days
+            if modified.tzinfo is None:
+                modified = modified.replace(tzinfo=timezone.utc)
+            days_old = (self.scan_time - modified).days
             if days_old < 30:
                 relevance_score += 3
             elif days_old < 90:
@@ -194,6 +228,7 @@ class GoogleDriveImporter:
             'name': file_info['name'],
             'mime_type': mime_type,
             'size': size,
+            'md5': file_info.get('md5Checksum'),
             'modified': file_info.get('modifiedTime'),
             'created': file_info.get('createdTime'),
             'owners': file_info.get('owners', []),
@@ -201,17 +236,15 @@ class GoogleDriveImporter:
             'web_link': file_info.get('webViewLink'),
             'relevance_score': min(relevance_score, 10),
             'category': category,
-            'keywords_found': [kw for kw in KOVA_KEYWORDS if kw in name]
+            'keywords_found': keywords_found
         }
 
-    def categorize_file(self, filename: str) -> str:
-        """Categorize file based on name and content"""
-        filename_lower = filename.lower()
-
-        # Check each category
-        for category, keywords in CATEGORIES.items():
-            if any(kw in filename_lower for kw in keywords):
-                return category
+    def categorize_file(self, name_lower: str) -> str:
+        """Categorize file based on its lowercased name"""
+        # One scan for every category's keywords; the best-ranked match wins
+        ranks = [KEYWORD_RANK[m.group(1)] for m in CATEGORY_RE.finditer(name_lower)]
+        if ranks:
+            return CATEGORY_NAMES[min(ranks)]
 
         return 'UNKNOWN'
 
@@ -219,13 +252,30 @@ class GoogleDriveImporter:
         """Find duplicate files"""
         self.log("\n🔍 Detecting duplicates...", Colors.BOLD)
 
-        # Group by name
-        by_name = {}
+        # Group by name and by content checksum in one pass. Drive reports
+        # md5Checksum for binary files, so identical content is caught even
+        # under different names; native Google Docs have no checksum.
+        by_name = defaultdict(list)
+        by_checksum = defaultdict(list)
         for f in files:
-            name = f['name'].lower()
-            if name not in by_name:
-                by_name[name] = []
-            by_name[name].append(f)
+            by_name[f['name'].lower()].append(f)
+            if f.get('md5'):
+                by_checksum[f['md5']].append(f)
+        by_name = dict(by_name)
+
+        # Find exact content duplicates
+        content_duplicates = []
+        for checksum, file_list in by_checksum.items():
+            if len(file_list) > 1:
+                content_duplicates.append({
+                    'type': 'exact_content',
+                    'md5': checksum,
+                    'name': file_list[0]['name'],
+                    'count': len(file_list),
+                    # Space freed by keeping a single copy
+                    'reclaimable_bytes': file_list[0]['size'] * (len(file_list) - 1),
+                    'files': file_list
+                })
 
         # Find exact name duplicates
         exact_duplicates = []
@@ -241,22 +291,58 @@ class GoogleDriveImporter:
         # Find similar names
         similar_duplicates = []
         names = list(by_name.keys())
-        for i, name1 in enumerate(names):
-            for name2 in names[i+1:]:
-                similarity = self.calculate_similarity(name1, name2)
-                if similarity > 0.8:  # 80% similar
-                    similar_duplicates.append({
-                        'type': 'similar_name',
-                        'similarity': similarity,
-                        'name1': name1,
-                        'name2': name2,
-                        'files': by_name[name1] + by_name[name2]
-                    })
+        # Names are already lowercased keys, so each is tokenized just once
+        word_sets = [frozenset(WORD_RE.findall(name)) for name in names]
+        for i, j in self.similar_name_candidates(word_sets):
+            name1, name2 = names[i], names[j]
+            similarity = self.word_similarity(word_sets[i], word_sets[j])
+            if similarity > SIMILARITY_THRESHOLD:
+                similar_duplicates.append({
+                    'type': 'similar_name',
+                    'similarity': similarity,
+                    'name1': name1,
+                    'name2': name2,
+                    'files': by_name[name1] + by_name[name2]
+                })
 
+        reclaimable = sum(d['reclaimable_bytes'] for d in content_duplicates)
+        self.log(f"  Found {len(content_duplicates)} exact content duplicates "
+                 f"({self.format_size(reclaimable)} reclaimable)", Colors.YELLOW)
         self.log(f"  Found {len(exact_duplicates)} exact name duplicates", Colors.YELLOW)
         self.log(f"  Found {len(similar_duplicates)} similar name duplicates", Colors.YELLOW)
 
-        return exact_duplicates + similar_duplicates
+        return content_duplicates + exact_duplicates + similar_duplicates
+
+    def similar_name_candidates(self, word_sets: List[frozenset]) -> List[tuple]:
+        """
+        Index pairs (i < j) of word sets that may pass SIMILARITY_THRESHOLD
+
+        Prefix filtering: with each name's words ordered rarest first, two
+        names can only be that similar if their first few words overlap, so
+        pairs are gathered from an index on those words instead of comparing
+        every pair. Pairs whose set sizes alone rule the threshold out (the
+        smaller set must hold over SIMILARITY_THRESHOLD of the larger) are
+        dropped before scoring. No pair above the threshold is missed.
+        """
+        frequency = Counter(word for words in word_sets for word in words)
+        sizes = [len(words) for words in word_sets]
+
+        index = defaultdict(list)
+        candidates = set()
+        for j, words in enumerate(word_sets):
+            if not words:
+                continue
+            ordered = sorted(words, key=lambda word: (frequency[word], word))
+            # Rounding the kept share down only lengthens the prefix
+            prefix_len = len(ordered) - int(SIMILARITY_THRESHOLD * len(ordered)) + 1
+            size = sizes[j]
+            for word in ordered[:prefix_len]:
+                for i in index[word]:
+                    if min(sizes[i], size) > SIMILARITY_THRESHOLD * max(sizes[i], size):
+                        candidates.add((i, j))
+                index[word].append(j)
+
+        return sorted(candidates)
 
     def calculate_similarity(self, s1: str, s2: str) -> float:
         """Calculate similarity between two strings"""
@@ -265,44 +351,23 @@ class GoogleDriveImporter:
             return 1.0
 
         # Convert to sets of words
-        words1 = set(re.findall(r'\w+', s1.lower()))
-        words2 = set(re.findall(r'\w+', s2.lower()))
+        words1 = set(WORD_RE.findall(s1.lower()))
+        words2 = set(WORD_RE.findall(s2.lower()))
+        return self.word_similarity(words1, words2)
 
+    def word_similarity(self, words1: frozenset, words2: frozenset) -> float:
+        """Jaccard similarity of two pre-tokenized, lowercased names"""
         if not words1 or not words2:
             return 0.0
 
-        # Jaccard similarity
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-
-        return len(intersection) / len(union)
-
-    def generate_report(self, analyzed_files: List[Dict[str, Any]], duplicates: List[Dict[str, Any]]):
-        """Generate analysis report"""
-        self.log("\n" + "="*80, Colors.BOLD)
-        self.log("📊 KOVA FILE ANALYSIS REPORT", Colors.BOLD)
-        self.log("="*80, Colors.BOLD)
-
-        # Summary
-        total_files = len(analyzed_files)
-        total_size = sum(f['size'] for f in analyzed_files)
-
-        self.log(f"\n📁 Total Files: {total_files}", Colors.CYAN)
-        self.log(f"💾 Total Size: {self.format_size(total_size)}", Colors.CYAN)
+        # Jaccard similarity; |A ∪ B| = |A| + |B| - |A ∩ B|
+        shared = len(words1 & words2)
+        return shared / (len(words1) + len(words2) - shared)
 
-        # By category
-        self.log(f"\n📂 Files by Category:", Colors.BOLD)
+    def summarize_files(self, analyzed_files: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Total size, category counts and relevance buckets in a single pass"""
+        total_size = 0
         category_counts = {}
-        for f in analyzed_files:
-            cat = f['category']
-            category_counts[cat] = category_counts.get(cat, 0) + 1
-
-        for cat, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-            pct = (count / total_files) * 100
-            self.log(f"  {cat:10s}: {count:4d} files ({pct:5.1f}%)", Colors.YELLOW)
-
-        # By relevance
-        self.log(f"\n⭐ Files by Relevance Score:", Colors.BOLD)
         relevance_counts = {
             'Critical (9-10)': 0,
             'Important (7-8)': 0,
@@ -312,6 +377,10 @@ class GoogleDriveImporter:
         }
 
         for f in analyzed_files:
+            total_size += f['size']
+            cat = f['category']
+            category_counts[cat] = category_counts.get(cat, 0) + 1
+
             score = f['relevance_score']
             if score >= 9:
                 relevance_counts['Critical (9-10)'] += 1
@@ -324,7 +393,42 @@ class GoogleDriveImporter:
             else:
                 relevance_counts['Irrelevant (1-2)'] += 1
 
-        for level, count in relevance_counts.items():
+        return {
+            'total_files': len(analyzed_files),
+            'total_size': total_size,
+            'category_counts': category_counts,
+            'relevance_counts': relevance_counts,
+            'low_relevance': relevance_counts['Questionable (3-4)'] + relevance_counts['Irrelevant (1-2)']
+        }
+
+    def generate_report(self, analyzed_files: List[Dict[str, Any]], duplicates: List[Dict[str, Any]],
+                        summary: Optional[Dict[str, Any]] = None):
+        """Generate analysis report"""
+        if summary is None:
+            summary = self.summarize_files(analyzed_files)
+
+        self.log("\n" + "="*80, Colors.BOLD)
+        self.log("📊 KOVA FILE ANALYSIS REPORT", Colors.BOLD)
+        self.log("="*80, Colors.BOLD)
+
+        # Summary
+        total_files = summary['total_files']
+
+        self.log(f"\n📁 Total Files: {total_files}", Colors.CYAN)
+        self.log(f"💾 Total Size: {self.format_size(summary['total_size'])}", Colors.CYAN)
+
+        # By category
+        self.log(f"\n📂 Files by Category:", Colors.BOLD)
+        category_counts = summary['category_counts']
+
+        for cat, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
+            pct = (count / total_files) * 100
+            self.log(f"  {cat:10s}: {count:4d} files ({pct:5.1f}%)", Colors.YELLOW)
+
+        # By relevance
+        self.log(f"\n⭐ Files by Relevance Score:", Colors.BOLD)
+
+        for level, count in summary['relevance_counts'].items():
             pct = (count / total_files) * 100
             self.log(f"  {level:20s}: {count:4d} files ({pct:5.1f}%)", Colors.GREEN)
 
@@ -332,7 +436,10 @@ class GoogleDriveImporter:
         self.log(f"\n🔁 Duplicates Found: {len(duplicates)}", Colors.BOLD)
         if duplicates:
             for dup in duplicates[:10]:  # Show first 10
-                if dup['type'] == 'exact_name':
+                if dup['type'] == 'exact_content':
+                    self.log(f"  Content: '{dup['name']}' ({dup['count']} identical files, "
+                             f"{self.format_size(dup['reclaimable_bytes'])} reclaimable)", Colors.YELLOW)
+                elif dup['type'] == 'exact_name':
                     self.log(f"  Exact: '{dup['name']}' ({dup['count']} copies)", Colors.YELLOW)
                 else:
                     self.log(f"  Similar: {dup['similarity']:.0%} - '{dup['name1']}' & '{dup['name2']}'", Colors.YELLOW)
@@ -343,7 +450,7 @@ class GoogleDriveImporter:
         # Recommendations
         self.log(f"\n💡 Recommendations:", Colors.BOLD)
 
-        low_relevance = sum(1 for f in analyzed_files if f['relevance_score'] < 5)
+        low_relevance = summary['low_relevance']
         if low_relevance > 0:
             self.log(f"  • Review {low_relevance} low-relevance files for deletion", Colors.CYAN)
 
@@ -365,8 +472,20 @@ class GoogleDriveImporter:
             size /= 1024.0
         return f"{size:.1f} TB"
 
-    def save_inventory(self, analyzed_files: List[Dict[str, Any]], duplicates: List[Dict[str, Any]]):
+    def write_json(self, path: Path, data: Any):
+        """Write indented JSON, with orjson's C encoder when it is installed"""
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+
+    def save_inventory(self, analyzed_files: List[Dict[str, Any]], duplicates: List[Dict[str, Any]],
+                       summary: Optional[Dict[str, Any]] = None):
         """Save inventory to JSON"""
+        if summary is None:
+            summary = self.summarize_files(analyzed_files)
+
         output_dir = Path(__file__).parent.parent / 'kova_file_inventory'
         output_dir.mkdir(exist_ok=True)
 
@@ -374,13 +493,11 @@ class GoogleDriveImporter:
 
         # Save analyzed files
         inventory_file = output_dir / f'inventory_{timestamp}.json'
-        with open(inventory_file, 'w') as f:
-            json.dump(analyzed_files, f, indent=2)
+        self.write_json(inventory_file, analyzed_files)
 
         # Save duplicates
         duplicates_file = output_dir / f'duplicates_{timestamp}.json'
-        with open(duplicates_file, 'w') as f:
-            json.dump(duplicates, f, indent=2)
+        self.write_json(duplicates_file, duplicates)
 
         # Save summary
         summary_file = output_dir / f'summary_{timestamp}.txt'
@@ -390,11 +507,7 @@ class GoogleDriveImporter:
             f.write(f"\nTotal Files: {len(analyzed_files)}\n")
             f.write(f"Total Duplicates: {len(duplicates)}\n")
             f.write(f"\nFiles by Category:\n")
-            category_counts = {}
-            for file in analyzed_files:
-                cat = file['category']
-                category_counts[cat] = category_counts.get(cat, 0) + 1
-            for cat, count in sorted(category_counts.items()):
+            for cat, count in sorted(summary['category_counts'].items()):
                 f.write(f"  {cat}: {count}\n")
 
         self.log(f"\n💾 Inventory saved:", Colors.BOLD)
@@ -430,11 +543,14 @@ class GoogleDriveImporter:
         # Find duplicates
         duplicates = self.find_duplicates(analyzed_files)
 
+        # Tally once for both the report and the saved summary
+        summary = self.summarize_files(analyzed_files)
+
         # Generate report
-        self.generate_report(analyzed_files, duplicates)
+        self.generate_report(analyzed_files, duplicates, summary)
 
         # Save inventory
-        self.save_inventory(analyzed_files, duplicates)
+        self.save_inventory(analyzed_files, duplicates, summary)
 
         self.log("\n✅ Analysis complete!", Colors.GREEN)
 
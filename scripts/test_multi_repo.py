@@ -32,6 +32,15 @@ class MultiRepoTester:
         self.results = []
         self.passed = 0
         self.failed = 0
+        self.client = None
+
+    async def __aenter__(self):
+        # One client for every endpoint test, so they share pooled connections
+        self.client = httpx.AsyncClient(base_url=self.base_url, timeout=10.0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
 
     def log(self, message: str, color: str = Colors.RESET):
         """Print colored log message"""
@@ -53,9 +62,8 @@ class MultiRepoTester:
     async def test_health(self) -> bool:
         """Test basic health endpoint"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/health")
-                return response.status_code == 200
+            response = await self.client.get("/health")
+            return response.status_code == 200
         except Exception as e:
             self.log(f"Health check failed: {e}", Colors.RED)
             return False
@@ -63,21 +71,20 @@ class MultiRepoTester:
     async def test_list_repos(self) -> bool:
         """Test listing all repositories"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/multi-repo/list")
+            response = await self.client.get("/multi-repo/list")
 
-                if response.status_code != 200:
-                    self.log_test("List Repositories", False, f"Status code: {response.status_code}")
-                    return False
+            if response.status_code != 200:
+                self.log_test("List Repositories", False, f"Status code: {response.status_code}")
+                return False
 
-                data = response.json()
-                if data.get("status") != "success":
-                    self.log_test("List Repositories", False, "Response status not success")
-                    return False
+            data = response.json()
+            if data.get("status") != "success":
+                self.log_test("List Repositories", False, "Response status not success")
+                return False
 
-                repo_count = data.get("data", {}).get("count", 0)
-                self.log_test("List Repositories", True, f"Found {repo_count} repositories")
-                return True
+            repo_count = data.get("data", {}).get("count", 0)
+            self.log_test("List Repositories", True, f"Found {repo_count} repositories")
+            return True
         except Exception as e:
             self.log_test("List Repositories", False, str(e))
             return False
@@ -85,21 +92,20 @@ class MultiRepoTester:
     async def test_get_status(self) -> bool:
         """Test getting status of all repositories"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.base_url}/multi-repo/status")
+            response = await self.client.get("/multi-repo/status", timeout=30.0)
 
-                if response.status_code != 200:
-                    self.log_test("Get Repo Status", False, f"Status code: {response.status_code}")
-                    return False
+            if response.status_code != 200:
+                self.log_test("Get Repo Status", False, f"Status code: {response.status_code}")
+                return False
 
-                data = response.json()
-                if data.get("status") != "success":
-                    self.log_test("Get Repo Status", False, "Response status not success")
-                    return False
+            data = response.json()
+            if data.get("status") != "success":
+                self.log_test("Get Repo Status", False, "Response status not success")
+                return False
 
-                total_repos = data.get("data", {}).get("total_repos", 0)
-                self.log_test("Get Repo Status", True, f"Checked {total_repos} repositories")
-                return True
+            total_repos = data.get("data", {}).get("total_repos", 0)
+            self.log_test("Get Repo Status", True, f"Checked {total_repos} repositories")
+            return True
         except Exception as e:
             self.log_test("Get Repo Status", False, str(e))
             return False
@@ -107,17 +113,16 @@ class MultiRepoTester:
     async def test_discover_repos(self) -> bool:
         """Test discovering new repositories"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.base_url}/multi-repo/discover")
+            response = await self.client.get("/multi-repo/discover", timeout=30.0)
 
-                if response.status_code != 200:
-                    self.log_test("Discover Repos", False, f"Status code: {response.status_code}")
-                    return False
+            if response.status_code != 200:
+                self.log_test("Discover Repos", False, f"Status code: {response.status_code}")
+                return False
 
-                data = response.json()
-                new_repo_count = data.get("data", {}).get("count", 0)
-                self.log_test("Discover Repos", True, f"Found {new_repo_count} new repositories")
-                return True
+            data = response.json()
+            new_repo_count = data.get("data", {}).get("count", 0)
+            self.log_test("Discover Repos", True, f"Found {new_repo_count} new repositories")
+            return True
         except Exception as e:
             self.log_test("Discover Repos", False, str(e))
             return False
@@ -125,18 +130,17 @@ class MultiRepoTester:
     async def test_get_config(self) -> bool:
         """Test getting repository configuration"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/multi-repo/config")
+            response = await self.client.get("/multi-repo/config")
 
-                if response.status_code != 200:
-                    self.log_test("Get Config", False, f"Status code: {response.status_code}")
-                    return False
+            if response.status_code != 200:
+                self.log_test("Get Config", False, f"Status code: {response.status_code}")
+                return False
 
-                data = response.json()
-                config = data.get("data", {})
-                owner = config.get("github_owner", "")
-                self.log_test("Get Config", True, f"GitHub owner: {owner}")
-                return True
+            data = response.json()
+            config = data.get("data", {})
+            owner = config.get("github_owner", "")
+            self.log_test("Get Config", True, f"GitHub owner: {owner}")
+            return True
         except Exception as e:
             self.log_test("Get Config", False, str(e))
             return False
@@ -144,22 +148,22 @@ class MultiRepoTester:
     async def test_sync_repos(self, include_claude: bool = False) -> bool:
         """Test syncing repositories"""
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                payload = {"include_claude": include_claude}
-                response = await client.post(
-                    f"{self.base_url}/multi-repo/sync",
-                    json=payload
-                )
-
-                if response.status_code != 200:
-                    self.log_test("Sync Repositories", False, f"Status code: {response.status_code}")
-                    return False
+            payload = {"include_claude": include_claude}
+            response = await self.client.post(
+                "/multi-repo/sync",
+                json=payload,
+                timeout=60.0
+            )
+
+            if response.status_code != 200:
+                self.log_test("Sync Repositories", False, f"Status code: {response.status_code}")
+                return False
 
-                data = response.json()
-                repos_synced = data.get("data", {}).get("repos_synced", 0)
-                test_name = "Sync Repositories (with Claude)" if include_claude else "Sync Repositories"
-                self.log_test(test_name, True, f"Synced {repos_synced} repositories")
-                return True
+            data = response.json()
+            repos_synced = data.get("data", {}).get("repos_synced", 0)
+            test_name = "Sync Repositories (with Claude)" if include_claude else "Sync Repositories"
+            self.log_test(test_name, True, f"Synced {repos_synced} repositories")
+            return True
         except Exception as e:
             test_name = "Sync Repositories (with Claude)" if include_claude else "Sync Repositories"
             self.log_test(test_name, False, str(e))
@@ -242,11 +246,14 @@ class MultiRepoTester:
         else:
             self.log_test("Health Check", True, "API is running")
 
-            # Run API tests
-            await self.test_list_repos()
-            await self.test_get_config()
-            await self.test_get_status()
-            await self.test_discover_repos()
+            # The read-only checks are independent, so run them side by side;
+            # sync changes state and runs on its own afterwards
+            await asyncio.gather(
+                self.test_list_repos(),
+                self.test_get_config(),
+                self.test_get_status(),
+                self.test_discover_repos()
+            )
             await self.test_sync_repos(include_claude=False)
 
         # Print summary
@@ -273,8 +280,8 @@ class MultiRepoTester:
 
 async def main():
     """Main entry point"""
-    tester = MultiRepoTester()
-    exit_code = await tester.run_all_tests()
+    async with MultiRepoTester() as tester:
+        exit_code = await tester.run_all_tests()
     sys.exit(exit_code)
 
 
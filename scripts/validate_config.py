@@ -7,9 +7,42 @@ Validates kova_repos_config.json structure and content.
 
 import json
 import sys
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+REQUIRED_REPO_FIELDS = ["name", "full_name", "type", "enabled"]
+RECOMMENDED_REPO_FIELDS = ["description", "sync_priority", "features"]
+VALID_REPO_TYPES = ["core", "service", "frontend", "experimental"]
+
+# Settings block -> (report heading, label used in warnings, recommended
+# fields and their types)
+SETTINGS_SPEC = {
+    "sync_settings": ("Sync Settings", "sync", {
+        "auto_sync_enabled": bool,
+        "sync_interval_minutes": int,
+        "sync_on_push": bool,
+        "sync_on_pr": bool,
+        "cross_repo_notifications": bool
+    }),
+    "discovery_settings": ("Discovery Settings", "discovery", {
+        "auto_discover_new_repos": bool,
+        "repo_name_pattern": str,
+        "watch_for_new_repos": bool
+    }),
+    "integration_settings": ("Integration Settings", "integration", {
+        "claude_api_enabled": bool,
+        "github_webhooks_enabled": bool,
+        "cross_repo_prs": bool,
+        "unified_changelog": bool
+    }),
+}
+
 
 class Colors:
     """ANSI color codes"""
@@ -59,8 +92,9 @@ class ConfigValidator:
     def validate_json_format(self) -> bool:
         """Validate JSON format"""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            data = self.config_path.read_bytes()
+            # orjson's decode error subclasses json.JSONDecodeError
+            self.config = orjson.loads(data) if orjson is not None else json.loads(data)
             self.success("Valid JSON format")
             return True
         except json.JSONDecodeError as e:
@@ -106,183 +140,139 @@ class ConfigValidator:
         return True
 
     def validate_repositories(self) -> bool:
-        """Validate repositories list"""
+        """Validate repositories list, including duplicate names"""
         repos = self.config.get("repositories", [])
 
         if not repos:
             self.warning("No repositories configured")
             return True
 
-        required_repo_fields = ["name", "full_name", "type", "enabled"]
-        recommended_repo_fields = ["description", "sync_priority", "features"]
-        valid_repo_types = ["core", "service", "frontend", "experimental"]
+        github_owner = self.config.get("github_owner")
+        seen_names = set()
+        seen_full_names = set()
 
         all_valid = True
         for i, repo in enumerate(repos):
-            self.log(f"\n  Validating repo #{i + 1}: {repo.get('name', 'unknown')}", Colors.BLUE)
-
-            # Check required fields
-            for field in required_repo_fields:
-                if field not in repo:
-                    self.error(f"  Repo '{repo.get('name', 'unknown')}' missing required field: {field}")
-                    all_valid = False
-
-            # Check recommended fields
-            for field in recommended_repo_fields:
-                if field not in repo:
-                    self.warning(f"  Repo '{repo.get('name', 'unknown')}' missing recommended field: {field}")
-
-            # Validate repo type
-            if "type" in repo and repo["type"] not in valid_repo_types:
-                self.warning(f"  Repo type '{repo['type']}' not in standard types: {valid_repo_types}")
-
-            # Validate full_name format
-            if "full_name" in repo:
-                full_name = repo["full_name"]
-                if "/" not in full_name:
-                    self.error(f"  Invalid full_name format: {full_name} (should be 'owner/repo')")
-                    all_valid = False
-                else:
-                    owner, name = full_name.split("/", 1)
-                    if owner != self.config.get("github_owner"):
-                        self.warning(f"  Repo owner '{owner}' doesn't match github_owner '{self.config.get('github_owner')}'")
-
-            # Validate sync_priority
-            if "sync_priority" in repo:
-                priority = repo["sync_priority"]
-                if not isinstance(priority, int) or priority < 1 or priority > 5:
-                    self.warning(f"  sync_priority should be between 1-5, got: {priority}")
-
-            # Validate features
-            if "features" in repo:
-                if not isinstance(repo["features"], list):
-                    self.error(f"  'features' should be a list")
-                    all_valid = False
+            if not self._validate_repo(i, repo, github_owner, seen_names, seen_full_names):
+                all_valid = False
 
         if all_valid:
             self.success(f"All {len(repos)} repositories valid")
+        if len(seen_names) == len(seen_full_names) == len(repos):
+            self.success("No duplicate repositories found")
         return all_valid
 
-    def validate_sync_settings(self) -> bool:
-        """Validate sync settings"""
-        settings = self.config.get("sync_settings", {})
-
-        recommended_fields = {
-            "auto_sync_enabled": bool,
-            "sync_interval_minutes": int,
-            "sync_on_push": bool,
-            "sync_on_pr": bool,
-            "cross_repo_notifications": bool
-        }
-
-        all_valid = True
-        for field, expected_type in recommended_fields.items():
-            if field not in settings:
-                self.warning(f"Missing recommended sync setting: {field}")
-            elif not isinstance(settings[field], expected_type):
-                self.error(f"sync_settings.{field} should be {expected_type.__name__}")
-                all_valid = False
-            else:
-                self.success(f"sync_settings.{field}: {settings[field]}")
-
-        return all_valid
-
-    def validate_discovery_settings(self) -> bool:
-        """Validate discovery settings"""
-        settings = self.config.get("discovery_settings", {})
-
-        recommended_fields = {
-            "auto_discover_new_repos": bool,
-            "repo_name_pattern": str,
-            "watch_for_new_repos": bool
-        }
-
-        all_valid = True
-        for field, expected_type in recommended_fields.items():
-            if field not in settings:
-                self.warning(f"Missing recommended discovery setting: {field}")
-            elif not isinstance(settings[field], expected_type):
-                self.error(f"discovery_settings.{field} should be {expected_type.__name__}")
-                all_valid = False
+    def _validate_repo(self, i: int, repo: Dict[str, Any], github_owner: Any,
+                       seen_names: set, seen_full_names: set) -> bool:
+        """Run every per-repo check on one repository entry"""
+        name = repo.get("name", "unknown")
+        self.log(f"\n  Validating repo #{i + 1}: {name}", Colors.BLUE)
+
+        valid = True
+
+        # Check required fields
+        for field in REQUIRED_REPO_FIELDS:
+            if field not in repo:
+                self.error(f"  Repo '{name}' missing required field: {field}")
+                valid = False
+
+        # Check recommended fields
+        for field in RECOMMENDED_REPO_FIELDS:
+            if field not in repo:
+                self.warning(f"  Repo '{name}' missing recommended field: {field}")
+
+        # Validate repo type
+        if "type" in repo and repo["type"] not in VALID_REPO_TYPES:
+            self.warning(f"  Repo type '{repo['type']}' not in standard types: {VALID_REPO_TYPES}")
+
+        # Validate full_name format
+        if "full_name" in repo:
+            full_name = repo["full_name"]
+            if "/" not in full_name:
+                self.error(f"  Invalid full_name format: {full_name} (should be 'owner/repo')")
+                valid = False
             else:
-                self.success(f"discovery_settings.{field}: {settings[field]}")
-
-        return all_valid
-
-    def validate_integration_settings(self) -> bool:
-        """Validate integration settings"""
-        settings = self.config.get("integration_settings", {})
-
-        recommended_fields = {
-            "claude_api_enabled": bool,
-            "github_webhooks_enabled": bool,
-            "cross_repo_prs": bool,
-            "unified_changelog": bool
-        }
+                owner = full_name.split("/", 1)[0]
+                if owner != github_owner:
+                    self.warning(f"  Repo owner '{owner}' doesn't match github_owner '{github_owner}'")
+
+        # Validate sync_priority
+        if "sync_priority" in repo:
+            priority = repo["sync_priority"]
+            if not isinstance(priority, int) or priority < 1 or priority > 5:
+                self.warning(f"  sync_priority should be between 1-5, got: {priority}")
+
+        # Validate features
+        if "features" in repo:
+            if not isinstance(repo["features"], list):
+                self.error(f"  'features' should be a list")
+                valid = False
+
+        # Check for duplicates of earlier entries
+        repo_name = repo.get("name")
+        if repo_name in seen_names:
+            self.error(f"Duplicate name: {repo_name}")
+            valid = False
+        seen_names.add(repo_name)
+
+        full_name = repo.get("full_name")
+        if full_name in seen_full_names:
+            self.error(f"Duplicate full_name: {full_name}")
+            valid = False
+        seen_full_names.add(full_name)
+
+        return valid
+
+    def validate_settings(self, section: str) -> bool:
+        """Validate one settings block against SETTINGS_SPEC"""
+        settings = self.config.get(section, {})
+        _, label, recommended_fields = SETTINGS_SPEC[section]
 
         all_valid = True
         for field, expected_type in recommended_fields.items():
             if field not in settings:
-                self.warning(f"Missing recommended integration setting: {field}")
+                self.warning(f"Missing recommended {label} setting: {field}")
             elif not isinstance(settings[field], expected_type):
-                self.error(f"integration_settings.{field} should be {expected_type.__name__}")
+                self.error(f"{section}.{field} should be {expected_type.__name__}")
                 all_valid = False
             else:
-                self.success(f"integration_settings.{field}: {settings[field]}")
+                self.success(f"{section}.{field}: {settings[field]}")
 
         return all_valid
 
-    def check_duplicates(self) -> bool:
-        """Check for duplicate repositories"""
-        repos = self.config.get("repositories", [])
-        names = [repo.get("name") for repo in repos]
-        full_names = [repo.get("full_name") for repo in repos]
-
-        duplicates = []
-        seen_names = set()
-        seen_full_names = set()
-
-        for name in names:
-            if name in seen_names:
-                duplicates.append(f"Duplicate name: {name}")
-            seen_names.add(name)
-
-        for full_name in full_names:
-            if full_name in seen_full_names:
-                duplicates.append(f"Duplicate full_name: {full_name}")
-            seen_full_names.add(full_name)
-
-        if duplicates:
-            for dup in duplicates:
-                self.error(dup)
-            return False
-        else:
-            self.success("No duplicate repositories found")
-            return True
-
     def validate_all(self) -> Tuple[bool, Dict[str, Any]]:
         """Run all validations"""
         self.log(f"\n{Colors.BOLD}=== Validating Kova AI Repository Configuration ==={Colors.RESET}\n")
         self.log(f"Config file: {Colors.BLUE}{self.config_path}{Colors.RESET}\n")
 
         # Run validations
-        validations = [
+        all_passed = self.run_validations([
             ("File Existence", self.validate_file_exists),
             ("JSON Format", self.validate_json_format),
-        ]
+        ])
 
         # Only run these if file exists and is valid JSON
         if self.config:
-            validations.extend([
+            all_passed = self.run_validations([
                 ("Required Fields", self.validate_required_fields),
                 ("GitHub Owner", self.validate_github_owner),
                 ("Repositories", self.validate_repositories),
-                ("Sync Settings", self.validate_sync_settings),
-                ("Discovery Settings", self.validate_discovery_settings),
-                ("Integration Settings", self.validate_integration_settings),
-                ("Duplicate Check", self.check_duplicates),
-            ])
+            ] + [
+                (title, partial(self.validate_settings, section))
+                for section, (title, _, _) in SETTINGS_SPEC.items()
+            ]) and all_passed
+
+        # Print summary
+        self.print_summary(all_passed)
 
+        return all_passed, {
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "config": self.config
+        }
+
+    def run_validations(self, validations: List[Tuple[str, Any]]) -> bool:
+        """Run each named validator in turn; False if any of them failed"""
         all_passed = True
         for name, validator in validations:
             self.log(f"\n{Colors.BOLD}{name}:{Colors.RESET}")
@@ -292,15 +282,7 @@ class ConfigValidator:
             except Exception as e:
                 self.error(f"Validation failed: {e}")
                 all_passed = False
-
-        # Print summary
-        self.print_summary(all_passed)
-
-        return all_passed, {
-            "errors": self.errors,
-            "warnings": self.warnings,
-            "config": self.config
-        }
+        return all_passed
 
     def print_summary(self, passed: bool):
         """Print validation summary"""
@@ -316,18 +298,20 @@ class ConfigValidator:
 
 def main():
     """Main entry point"""
-    # Find config file
-    config_path = Path(__file__).parent.parent / "kova_repos_config.json"
-
-    if len(sys.argv) > 1:
-        config_path = Path(sys.argv[1])
-
-    # Validate
-    validator = ConfigValidator(config_path)
-    passed, results = validator.validate_all()
+    # Find config files; several can be checked in one run
+    config_paths = [Path(arg) for arg in sys.argv[1:]]
+    if not config_paths:
+        config_paths = [Path(__file__).parent.parent / "kova_repos_config.json"]
+
+    # Validate each with a fresh validator so errors stay per file
+    all_passed = True
+    for config_path in config_paths:
+        validator = ConfigValidator(config_path)
+        passed, results = validator.validate_all()
+        all_passed = all_passed and passed
 
     # Exit with appropriate code
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if all_passed else 1)
 
 
 if __name__ == "__main__":